@@ -5,32 +5,59 @@ Translated from ZIL verb handling system
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, TYPE_CHECKING, List
+from typing import Dict, Any, Optional, TYPE_CHECKING, List, Tuple, Deque, Callable
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum
+from collections import deque
+from itertools import islice
+from functools import lru_cache
+from importlib import import_module
+from string import Formatter
 import logging
 
 if TYPE_CHECKING:
     from ..core.game_engine import GameEngine
     from ..core.game_object import GameObject
     from ..parser.parser import ParseResult
+    from ..io.interface import GameInterface
 
 logger = logging.getLogger(__name__)
 
 
-class CommandStatus(Enum):
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> Callable[..., str]:
+    """Pre-parse a message template into a fast formatter"""
+    parts = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        if name is not None and (spec or conversion or not name.isidentifier()):
+            # Specs, conversions and attribute/index fields need str.format
+            return template.format
+        parts.append((literal, name))
+    
+    def render(**kwargs) -> str:
+        out = []
+        for literal, name in parts:
+            out.append(literal)
+            if name is not None:
+                out.append(str(kwargs[name]))
+        return ''.join(out)
+    
+    return render
+
+
+class CommandStatus(IntEnum):
     """Command execution status"""
-    SUCCESS = "success"
-    FAILURE = "failure"
-    ERROR = "error"
-    PARTIAL = "partial"
-    QUIT = "quit"
-    RESTART = "restart"
+    SUCCESS = 0
+    FAILURE = 1
+    ERROR = 2
+    PARTIAL = 3
+    QUIT = 4
+    RESTART = 5
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CommandResult:
-    """Result of command execution"""
+    """Result of command execution (immutable, so instances can be shared)"""
     status: CommandStatus
     message: str
     consumed_time: bool = True
@@ -51,6 +78,29 @@ class CommandResult:
     def error(cls, message: str, **kwargs) -> 'CommandResult':
         """Create an error result"""
         return cls(status=CommandStatus.ERROR, message=message, **kwargs)
+    
+    # Status members are singletons, so identity checks are enough
+    @property
+    def is_success(self) -> bool:
+        """Whether the command succeeded"""
+        return self.status is CommandStatus.SUCCESS
+    
+    @property
+    def is_failure(self) -> bool:
+        """Whether the command failed"""
+        return self.status is CommandStatus.FAILURE
+    
+    @property
+    def is_error(self) -> bool:
+        """Whether the command errored"""
+        return self.status is CommandStatus.ERROR
+
+
+# Shared results for the dispatch checks; consumers treat results as read-only
+_DARK_RESULT = CommandResult.failure(
+    "It's too dark to see anything here. You need a light source."
+)
+_CANT_DO_RESULT = CommandResult.failure("You can't do that right now.")
 
 
 class Command(ABC):
@@ -59,10 +109,19 @@ class Command(ABC):
     Equivalent to ZIL verb routines
     """
     
+    __slots__ = ('engine', 'world', 'player', '_resolve_cache')
+    
+    # When set, the processor only checks for a direct object and skips
+    # the can_execute call entirely
+    requires_direct_object = False
+    
     def __init__(self, engine: 'GameEngine'):
         self.engine = engine
-        self.world = engine.world_manager if hasattr(engine, 'world_manager') else None
+        # GameEngine always defines world_manager (None until the world loads)
+        self.world = engine.world_manager
         self.player = self.world.player if self.world else None
+        # (scope, reference) -> object, valid for the current turn only
+        self._resolve_cache: Dict[Tuple[str, str], Optional['GameObject']] = {}
         
     @abstractmethod
     def execute(self, parse_result: 'ParseResult') -> CommandResult:
@@ -71,7 +130,7 @@ class Command(ABC):
     
     def can_execute(self, parse_result: 'ParseResult') -> bool:
         """Check if command can be executed - default implementation"""
-        return True
+        return not self.requires_direct_object or parse_result.direct_object is not None
     
     def get_object(self, obj_ref: str) -> Optional['GameObject']:
         """Resolve object reference to actual object"""
@@ -81,6 +140,23 @@ class Command(ABC):
         # Try to find object in current room or inventory
         return self.world.find_object(obj_ref)
     
+    def get_direct_object(self, parse_result: 'ParseResult') -> Optional['GameObject']:
+        """Resolve the direct object (cached for the turn)"""
+        key = ('direct', parse_result.direct_object)
+        cache = self._resolve_cache
+        if key in cache:
+            return cache[key]
+        obj = cache[key] = self.get_object(parse_result.direct_object)
+        return obj
+    
+    def get_held_object(self, obj_ref: str) -> Optional['GameObject']:
+        """Get an object from player's inventory"""
+        if not obj_ref or not self.player:
+            return None
+        
+        # Search player's inventory
+        return self.player.find_content(obj_ref)
+    
     def get_current_room(self):
         """Get the current room"""
         if self.world:
@@ -89,7 +165,7 @@ class Command(ABC):
     
     def format_message(self, template: str, **kwargs) -> str:
         """Format a message with variable substitution"""
-        return template.format(**kwargs)
+        return _compile_template(template)(**kwargs)
     
     def is_dark(self) -> bool:
         """Check if current location is dark"""
@@ -99,6 +175,17 @@ class Command(ABC):
     def require_light(self) -> bool:
         """Check if command requires light"""
         return True  # Most commands need light; override for exceptions
+    
+    def begin_turn(self):
+        """Called by the processor before each execute; forgets objects resolved last turn"""
+        self._resolve_cache.clear()
+    
+    def get_interface(self) -> 'GameInterface':
+        """The engine's interface, created on first use if the engine has none yet"""
+        interface = self.engine.interface
+        if interface is None:
+            interface = self.engine.get_interface()
+        return interface
 
 
 class CommandProcessor:
@@ -111,102 +198,134 @@ class CommandProcessor:
         self.engine = engine
         self.commands: Dict[str, Command] = {}
         self.command_aliases: Dict[str, str] = {}
+        
+        # Bound once; verb dispatch is then a single C-level dict probe
+        self._command_get = self.commands.get
+        
+        # verb -> the handler's dispatch hooks, bound on first use so each
+        # turn skips the attribute lookups (see _bind_dispatch)
+        self._dispatch: Dict[str, Tuple[bool, Callable, Callable, Callable, Callable, Callable]] = {}
+        
+        # Suggestion indexes for unknown verbs, filled by register_command
+        self._by_first: Dict[str, List[str]] = {}
+        self._by_len: Dict[int, List[str]] = {}
+        self._verb_rank: Dict[str, int] = {}  # registration order
+        self._suggestion_cache: Dict[Tuple[str, int], List[str]] = {}
+        self._available_cache: Optional[List[str]] = None
+        
+        # Lazily built handlers: verb -> (module, class name)
+        self._factories: Dict[str, Tuple[str, str]] = {}
+        self._lazy_instances: Dict[Tuple[str, str], Command] = {}
         self._register_commands()
         
         # Track command history
-        self.command_history: List[str] = []
         self.max_history = 100
+        self.command_history: Deque[str] = deque(maxlen=self.max_history)
     
     def _register_commands(self):
         """Register all available commands"""
-        # Import here to avoid circular dependencies
-        from .movement import GoCommand, EnterCommand, ExitCommand
-        from .manipulation import (TakeCommand, DropCommand, OpenCommand, 
-                                 CloseCommand, LockCommand, UnlockCommand,
-                                 PutCommand, GiveCommand)
-        from .examination import LookCommand, ExamineCommand, SearchCommand, ReadCommand
-        from .communication import TalkCommand, AskCommand, TellCommand, AccuseCommand
-        from .meta_commands import (SaveCommand, LoadCommand, QuitCommand, 
-                                   InventoryCommand, ScoreCommand, WaitCommand,
-                                   HelpCommand, AboutCommand)
+        # Handlers are built on first use, so modules for verbs the player
+        # never types are not imported (this also avoids circular imports)
         
         # Movement commands
-        self.register_command('go', GoCommand(self.engine))
-        self.register_command('enter', EnterCommand(self.engine))
-        self.register_command('exit', ExitCommand(self.engine))
+        self.register_lazy(('go',), 'movement', 'GoCommand')
+        self.register_lazy(('enter',), 'movement', 'EnterCommand')
+        self.register_lazy(('exit',), 'movement', 'ExitCommand')
         
         # Manipulation commands
-        take_cmd = TakeCommand(self.engine)
-        self.register_command('take', take_cmd)
-        self.register_command('get', take_cmd)  # Alias
-        self.register_command('pick', take_cmd)  # Alias for "pick up"
-        
-        self.register_command('drop', DropCommand(self.engine))
-        self.register_command('open', OpenCommand(self.engine))
-        self.register_command('close', CloseCommand(self.engine))
-        self.register_command('lock', LockCommand(self.engine))
-        self.register_command('unlock', UnlockCommand(self.engine))
-        self.register_command('put', PutCommand(self.engine))
-        self.register_command('give', GiveCommand(self.engine))
+        self.register_lazy(('take', 'get', 'pick'), 'manipulation', 'TakeCommand')  # "pick up"
+        self.register_lazy(('drop',), 'manipulation', 'DropCommand')
+        self.register_lazy(('open',), 'manipulation', 'OpenCommand')
+        self.register_lazy(('close',), 'manipulation', 'CloseCommand')
+        self.register_lazy(('lock',), 'manipulation', 'LockCommand')
+        self.register_lazy(('unlock',), 'manipulation', 'UnlockCommand')
+        self.register_lazy(('put',), 'manipulation', 'PutCommand')
+        self.register_lazy(('give',), 'manipulation', 'GiveCommand')
         
         # Examination commands
-        look_cmd = LookCommand(self.engine)
-        self.register_command('look', look_cmd)
-        self.register_command('l', look_cmd)  # Shortcut
-        
-        examine_cmd = ExamineCommand(self.engine)
-        self.register_command('examine', examine_cmd)
-        self.register_command('x', examine_cmd)  # Shortcut
-        self.register_command('inspect', examine_cmd)  # Alias
-        
-        self.register_command('search', SearchCommand(self.engine))
-        self.register_command('read', ReadCommand(self.engine))
+        self.register_lazy(('look', 'l'), 'examination', 'LookCommand')
+        self.register_lazy(('examine', 'x', 'inspect'), 'examination', 'ExamineCommand')
+        self.register_lazy(('search',), 'examination', 'SearchCommand')
+        self.register_lazy(('read',), 'examination', 'ReadCommand')
         
         # Communication commands
-        self.register_command('talk', TalkCommand(self.engine))
-        self.register_command('ask', AskCommand(self.engine))
-        self.register_command('tell', TellCommand(self.engine))
-        self.register_command('accuse', AccuseCommand(self.engine))
+        self.register_lazy(('talk',), 'communication', 'TalkCommand')
+        self.register_lazy(('ask',), 'communication', 'AskCommand')
+        self.register_lazy(('tell',), 'communication', 'TellCommand')
+        self.register_lazy(('accuse',), 'communication', 'AccuseCommand')
         
         # Meta commands
-        self.register_command('save', SaveCommand(self.engine))
-        
-        load_cmd = LoadCommand(self.engine)
-        self.register_command('load', load_cmd)
-        self.register_command('restore', load_cmd)  # Alias
-        
-        self.register_command('quit', QuitCommand(self.engine))
-        
-        inventory_cmd = InventoryCommand(self.engine)
-        self.register_command('inventory', inventory_cmd)
-        self.register_command('i', inventory_cmd)  # Shortcut
-        
-        self.register_command('score', ScoreCommand(self.engine))
-        
-        wait_cmd = WaitCommand(self.engine)
-        self.register_command('wait', wait_cmd)
-        self.register_command('z', wait_cmd)  # Shortcut
-        
-        self.register_command('help', HelpCommand(self.engine))
-        self.register_command('about', AboutCommand(self.engine))
+        self.register_lazy(('save',), 'meta_commands', 'SaveCommand')
+        self.register_lazy(('load', 'restore'), 'meta_commands', 'LoadCommand')
+        self.register_lazy(('quit',), 'meta_commands', 'QuitCommand')
+        self.register_lazy(('inventory', 'i'), 'meta_commands', 'InventoryCommand')
+        self.register_lazy(('score',), 'meta_commands', 'ScoreCommand')
+        self.register_lazy(('wait', 'z'), 'meta_commands', 'WaitCommand')
+        self.register_lazy(('help',), 'meta_commands', 'HelpCommand')
+        self.register_lazy(('about',), 'meta_commands', 'AboutCommand')
+    
+    def _index_verb(self, verb_lower: str):
+        """Add a new verb to the suggestion and help indexes"""
+        if verb_lower in self.commands or verb_lower in self._factories:
+            return
+        self._verb_rank[verb_lower] = len(self._verb_rank)
+        self._by_first.setdefault(verb_lower[0], []).append(verb_lower)
+        self._by_len.setdefault(len(verb_lower), []).append(verb_lower)
+        self._suggestion_cache.clear()
+        self._available_cache = None
+    
+    def register_lazy(self, verbs: Tuple[str, ...], module: str, class_name: str):
+        """Register verbs whose handler is imported and built on first use"""
+        # All verbs in the group share one spec, and so one handler instance
+        spec = (module, class_name)
+        for verb in verbs:
+            verb_lower = verb.lower()
+            self._index_verb(verb_lower)
+            self._factories[verb_lower] = spec
+    
+    def _load_command(self, verb_lower: str) -> Optional[Command]:
+        """Build (or reuse) the handler for a lazily registered verb"""
+        spec = self._factories.get(verb_lower)
+        if spec is None:
+            return None
+        command = self._lazy_instances.get(spec)
+        if command is None:
+            module, class_name = spec
+            try:
+                command_class = getattr(import_module(f'.{module}', __package__), class_name)
+            except (ImportError, AttributeError) as e:
+                logger.error(f"Could not load handler {module}.{class_name} for '{verb_lower}': {e}")
+                return None
+            command = self._lazy_instances[spec] = command_class(self.engine)
+        self.commands[verb_lower] = command
+        return command
     
     def register_command(self, verb: str, command: Command):
         """Register a command handler for a verb"""
-        self.commands[verb.lower()] = command
+        verb_lower = verb.lower()
+        self._index_verb(verb_lower)
+        self._factories.pop(verb_lower, None)
+        self._dispatch.pop(verb_lower, None)
+        self.commands[verb_lower] = command
     
     def register_alias(self, alias: str, verb: str):
         """Register an alias for a verb"""
-        self.command_aliases[alias.lower()] = verb.lower()
+        # Aliases share the target's handler so dispatch is a single lookup
+        verb_lower = verb.lower()
+        self.command_aliases[alias.lower()] = verb_lower
+        self._available_cache = None
+        self.register_command(alias, self.get_command_lower(verb_lower))
     
     def get_command(self, verb: str) -> Optional[Command]:
         """Get command handler for a verb"""
-        verb_lower = verb.lower()
-        
-        # Check for alias
-        if verb_lower in self.command_aliases:
-            verb_lower = self.command_aliases[verb_lower]
-        
-        return self.commands.get(verb_lower)
+        return self.get_command_lower(verb.lower())
+    
+    def get_command_lower(self, verb_lower: str) -> Optional[Command]:
+        """Get command handler for an already-lowercased verb"""
+        command = self._command_get(verb_lower)
+        if command is None and self._factories:
+            command = self._load_command(verb_lower)
+        return command
     
     def execute(self, parse_result: 'ParseResult') -> CommandResult:
         """
@@ -233,35 +352,44 @@ class CommandProcessor:
         if not verb:
             return CommandResult.error("No verb found in command.")
         
-        command = self.get_command(verb)
+        verb_lower = parse_result.verb_lower or verb.lower()
+        hooks = self._dispatch.get(verb_lower)
+        if hooks is None:
+            command = self.get_command_lower(verb_lower)
+            
+            if not command:
+                # Try to give a helpful message
+                similar = self._find_similar_commands_lower(verb_lower)
+                if similar:
+                    return CommandResult.error(
+                        f"I don't know how to '{verb}'. Did you mean '{similar[0]}'?"
+                    )
+                return CommandResult.error(f"I don't know how to '{verb}'.")
+            
+            hooks = self._dispatch[verb_lower] = self._bind_dispatch(command)
         
-        if not command:
-            # Try to give a helpful message
-            similar = self._find_similar_commands(verb)
-            if similar:
-                return CommandResult.error(
-                    f"I don't know how to '{verb}'. Did you mean '{similar[0]}'?"
-                )
-            return CommandResult.error(f"I don't know how to '{verb}'.")
+        requires_direct_object, can_execute, require_light, is_dark, begin_turn, execute = hooks
         
         # Check if command can be executed
-        try:
-            if not command.can_execute(parse_result):
-                return CommandResult.failure("You can't do that right now.")
-        except Exception as e:
-            logger.warning(f"Error checking can_execute for {verb}: {e}")
-            # Continue anyway
+        if requires_direct_object:
+            if parse_result.direct_object is None:
+                return _CANT_DO_RESULT
+        else:
+            try:
+                if not can_execute(parse_result):
+                    return _CANT_DO_RESULT
+            except Exception as e:
+                logger.warning(f"Error checking can_execute for {verb}: {e}")
+                # Continue anyway
         
         # Check for darkness (most commands need light)
-        if hasattr(command, 'require_light') and command.require_light():
-            if hasattr(command, 'is_dark') and command.is_dark():
-                return CommandResult.failure(
-                    "It's too dark to see anything here. You need a light source."
-                )
+        if require_light() and is_dark():
+            return _DARK_RESULT
         
         # Execute command
         try:
-            result = command.execute(parse_result)
+            begin_turn()
+            result = execute(parse_result)
             
             # Ensure we have a valid result
             if not isinstance(result, CommandResult):
@@ -280,37 +408,57 @@ class CommandProcessor:
                 "An error occurred while executing that command."
             )
     
+    @staticmethod
+    def _bind_dispatch(command: Command) -> Tuple[bool, Callable, Callable, Callable, Callable, Callable]:
+        """
+        Resolve a handler's dispatch hooks once
+        The hooks are bound methods, so they still see the handler's
+        current engine, world and player on every call
+        """
+        return (command.requires_direct_object, command.can_execute,
+                command.require_light, command.is_dark,
+                command.begin_turn, command.execute)
+    
     def _add_to_history(self, command: str):
         """Add command to history"""
+        # The deque drops the oldest entry once max_history is reached
         self.command_history.append(command)
-        
-        # Limit history size
-        if len(self.command_history) > self.max_history:
-            self.command_history.pop(0)
     
     def _find_similar_commands(self, verb: str) -> List[str]:
         """Find commands similar to the given verb"""
-        similar = []
-        verb_lower = verb.lower()
-        
-        # Check for commands that start with the same letter
-        for cmd in self.commands:
-            if cmd.startswith(verb_lower[0]):
-                similar.append(cmd)
-        
-        # Check for commands with similar length
-        for cmd in self.commands:
-            if abs(len(cmd) - len(verb_lower)) <= 2:
-                if cmd not in similar:
-                    similar.append(cmd)
+        return self._find_similar_commands_lower(verb.lower())
+    
+    def _find_similar_commands_lower(self, verb_lower: str) -> List[str]:
+        """Find commands similar to an already-lowercased verb"""
+        # Suggestions depend only on the first letter and the length
+        key = (verb_lower[0], len(verb_lower))
+        similar = self._suggestion_cache.get(key)
+        if similar is None:
+            first, length = key
+            
+            # Commands that start with the same letter come first,
+            # then commands of similar length (within two characters);
+            # each group lists verbs in registration order
+            candidates = list(self._by_first.get(first, ()))
+            similar_length = []
+            for size in range(length - 2, length + 3):
+                similar_length.extend(self._by_len.get(size, ()))
+            candidates.extend(sorted(similar_length, key=self._verb_rank.__getitem__))
+            
+            similar = list(dict.fromkeys(candidates))[:3]  # Top 3 suggestions
+            self._suggestion_cache[key] = similar
         
-        return similar[:3]  # Return top 3 suggestions
+        return list(similar)
     
     def get_available_commands(self) -> List[str]:
         """Get list of all available commands"""
-        commands = list(self.commands.keys())
-        commands.extend(self.command_aliases.keys())
-        return sorted(set(commands))
+        # The command table only changes at registration time
+        if self._available_cache is None:
+            commands = list(self.commands.keys())
+            commands.extend(self._factories.keys())
+            commands.extend(self.command_aliases.keys())
+            self._available_cache = sorted(set(commands))
+        return list(self._available_cache)
     
     def get_command_help(self, verb: str = None) -> str:
         """Get help text for a command or all commands"""
@@ -334,12 +482,15 @@ class CommandProcessor:
     
     def get_history(self, count: int = 10) -> List[str]:
         """Get recent command history"""
-        return self.command_history[-count:]
+        history = self.command_history
+        return list(islice(history, max(0, len(history) - count), None))
 
 
 class MetaCommand(Command):
     """Base class for meta-commands that don't affect game state"""
     
+    __slots__ = ()
+    
     def __init__(self, engine: 'GameEngine'):
         super().__init__(engine)
     
@@ -351,6 +502,8 @@ class MetaCommand(Command):
 class MovementCommand(Command):
     """Base class for movement commands"""
     
+    __slots__ = ()
+    
     def __init__(self, engine: 'GameEngine'):
         super().__init__(engine)
     
@@ -397,65 +550,65 @@ class MovementCommand(Command):
         from ..core.game_object import ObjectFlag
         new_room.set_flag(ObjectFlag.VISITED)
         
-        # Return success with room description
-        description = new_room.get_room_description()
+        # Return success with room description, assembled in one join
+        parts = [new_room.get_room_description()]
         
         # Add exits to description
         exits = new_room.get_available_exits()
         if exits:
-            description += f"\n\nExits: {', '.join(exits)}"
+            parts.append(f"\n\nExits: {', '.join(exits)}")
         
         # List visible objects
+        player = self.player
         visible_items = [obj for obj in new_room.contents 
-                        if obj != self.player and obj.is_visible()]
+                        if obj is not player and obj.is_visible()]
         if visible_items:
-            description += "\n\nYou can see:"
-            for item in visible_items:
-                description += f"\n  {item.get_inventory_description()}"
+            parts.append("\n\nYou can see:")
+            parts.extend([f"\n  {item.get_inventory_description()}"
+                          for item in visible_items])
         
-        return CommandResult.success(description)
+        return CommandResult.success("".join(parts))
 
 
 class ManipulationCommand(Command):
     """Base class for object manipulation commands"""
     
-    def __init__(self, engine: 'GameEngine'):
-        super().__init__(engine)
+    __slots__ = ()
     
     def get_held_object(self, obj_ref: str) -> Optional['GameObject']:
-        """Get an object from player's inventory"""
-        if not obj_ref or not self.player:
-            return None
-        
-        # Search player's inventory
-        for obj in self.player.contents:
-            if obj.id == obj_ref or obj.name.lower() == obj_ref.lower():
-                return obj
-            # Check synonyms
-            if hasattr(obj, 'synonyms'):
-                if obj_ref.lower() in [s.lower() for s in obj.synonyms]:
-                    return obj
-        
-        return None
+        """Get an object from player's inventory (cached for the turn)"""
+        key = ('held', obj_ref)
+        cache = self._resolve_cache
+        if key in cache:
+            return cache[key]
+        obj = cache[key] = super().get_held_object(obj_ref)
+        return obj
     
     def get_room_object(self, obj_ref: str) -> Optional['GameObject']:
-        """Get an object from the current room"""
+        """Get an object from the current room (cached for the turn)"""
+        key = ('room', obj_ref)
+        cache = self._resolve_cache
+        if key in cache:
+            return cache[key]
+        obj = cache[key] = self._find_room_object(obj_ref)
+        return obj
+    
+    def _find_room_object(self, obj_ref: str) -> Optional['GameObject']:
+        """Look an object up in the current room"""
         room = self.get_current_room()
         if not room or not obj_ref:
             return None
         
         # Search room contents
-        for obj in room.contents:
-            if obj == self.player:
-                continue
-            if obj.id == obj_ref or obj.name.lower() == obj_ref.lower():
-                return obj
-            # Check synonyms
-            if hasattr(obj, 'synonyms'):
-                if obj_ref.lower() in [s.lower() for s in obj.synonyms]:
-                    return obj
-        
-        return None
+        obj = room.find_content(obj_ref)
+        if obj is self.player:
+            # The player shadows the word; look past them
+            ref_lower = obj_ref.lower()
+            for other in room.contents:
+                if other is not self.player and ref_lower in other._lookup_keys:
+                    return other
+            return None
+        return obj
     
     def get_visible_object(self, obj_ref: str) -> Optional['GameObject']:
         """Get a visible object (in room or inventory)"""
@@ -466,6 +619,30 @@ class ManipulationCommand(Command):
         
         # Check room
         return self.get_room_object(obj_ref)
+    
+    def _resolve_key(self, parse_result: 'ParseResult', key_id: str, verb: str,
+                     obj_name: str) -> Tuple[Optional['GameObject'], Optional[CommandResult]]:
+        """
+        Find the key for a lock/unlock: the one named in the command, else
+        the player's matching key. Returns (key, None) or (None, failure)
+        """
+        named = parse_result.indirect_object
+        if named:
+            # Key specified in command
+            key = self.get_held_object(named)
+            if not key:
+                return None, CommandResult.failure(f"You don't have the {named}.")
+            if key.id != key_id:
+                return None, CommandResult.failure(f"The {key.name} doesn't fit.")
+            return key, None
+        
+        # Look for the right key, falling back to an exact id match
+        key = self.get_held_object(key_id) or self.player._contents_by_id.get(key_id)
+        if not key:
+            return None, CommandResult.failure(
+                f"You need the right key to {verb} the {obj_name}."
+            )
+        return key, None
 
 
 # Specific command implementations would go in their respective files
@@ -6,14 +6,40 @@ from typing import TYPE_CHECKING
 from ..core.game_engine import GameState
 if TYPE_CHECKING:
     from ..parser.parser import ParseResult
+    from ..core.game_engine import GameEngine
 
 from .base_command import Command, CommandResult, CommandStatus
 from ..core.flags import ObjectFlag
 
+# Raw bit so the person check is a single int test per command
+_PERSON = ObjectFlag.PERSON.value
+
+# Shared results for the common miss paths; consumers treat results as read-only
+_NOT_HERE_RESULT = CommandResult(
+    status=CommandStatus.ERROR,
+    message="I don't see them here."
+)
+_NOT_HELD_RESULT = CommandResult(
+    status=CommandStatus.ERROR,
+    message="You don't have that."
+)
+
+# How a greeting is framed for each character mood (None is the default)
+_MOOD_TEMPLATES = {
+    'suspicious': lambda n, r: f'{n} eyes you suspiciously. "{r}"',
+    'hostile': lambda n, r: f'{n} glares at you. "I have nothing to say to you."',
+    None: lambda n, r: f'{n} says, "{r}"',
+}
+
+# Topics that make a character suspicious when raised
+_SUSPICIOUS_TOPICS = frozenset(('murder', 'death', 'killing'))
+
 
 class TalkCommand(Command):
     """Talk to someone - equivalent to V-TELL"""
     
+    __slots__ = ()
+    
     def can_execute(self, parse_result) -> bool:
         return parse_result.direct_object is not None
     
@@ -21,12 +47,9 @@ class TalkCommand(Command):
         character = self.get_object(parse_result.direct_object)
         
         if not character:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see them here."
-            )
+            return _NOT_HERE_RESULT
         
-        if not character.has_flag(ObjectFlag.PERSON):
+        if not (character._flags & _PERSON):
             return CommandResult(
                 status=CommandStatus.FAILURE,
                 message=f"You can't talk to the {character.name}."
@@ -39,12 +62,8 @@ class TalkCommand(Command):
         
         # Check character mood
         mood = self.world.character_manager.get_character_mood(character.id)
-        if mood == 'suspicious':
-            response = f"{character.name} eyes you suspiciously. \"{response}\""
-        elif mood == 'hostile':
-            response = f"{character.name} glares at you. \"I have nothing to say to you.\""
-        else:
-            response = f"{character.name} says, \"{response}\""
+        template = _MOOD_TEMPLATES.get(mood, _MOOD_TEMPLATES[None])
+        response = template(character.name, response)
         
         return CommandResult(
             status=CommandStatus.SUCCESS,
@@ -55,6 +74,8 @@ class TalkCommand(Command):
 class AskCommand(Command):
     """Ask someone about something - equivalent to V-ASK-ABOUT"""
     
+    __slots__ = ()
+    
     def can_execute(self, parse_result) -> bool:
         return parse_result.direct_object and parse_result.text
     
@@ -63,12 +84,9 @@ class AskCommand(Command):
         topic = parse_result.text.lower()
         
         if not character:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see them here."
-            )
+            return _NOT_HERE_RESULT
         
-        if not character.has_flag(ObjectFlag.PERSON):
+        if not (character._flags & _PERSON):
             return CommandResult(
                 status=CommandStatus.FAILURE,
                 message=f"You can't ask the {character.name} about things."
@@ -96,6 +114,8 @@ class AskCommand(Command):
 class TellCommand(Command):
     """Tell someone about something - equivalent to V-TELL-ABOUT"""
     
+    __slots__ = ()
+    
     def can_execute(self, parse_result) -> bool:
         return parse_result.direct_object and parse_result.text
     
@@ -104,12 +124,9 @@ class TellCommand(Command):
         topic = parse_result.text.lower()
         
         if not character:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see them here."
-            )
+            return _NOT_HERE_RESULT
         
-        if not character.has_flag(ObjectFlag.PERSON):
+        if not (character._flags & _PERSON):
             return CommandResult(
                 status=CommandStatus.FAILURE,
                 message=f"The {character.name} isn't listening."
@@ -123,7 +140,7 @@ class TellCommand(Command):
             response = f"{character.name} nods but says nothing."
         
         # Update character state based on what was told
-        if topic in ['murder', 'death', 'killing']:
+        if topic in _SUSPICIOUS_TOPICS:
             self.world.character_manager.make_suspicious(character.id)
         
         return CommandResult(
@@ -135,38 +152,28 @@ class TellCommand(Command):
 class ShowCommand(Command):
     """Show something to someone"""
     
+    __slots__ = ()
+    
     def can_execute(self, parse_result) -> bool:
         return parse_result.direct_object and parse_result.indirect_object
     
     def execute(self, parse_result) -> CommandResult:
-        obj = self.get_object(parse_result.direct_object)
+        # Only carried things can be shown
+        obj = self.get_held_object(parse_result.direct_object)
         character = self.get_object(parse_result.indirect_object)
         
         if not obj:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="You don't have that."
-            )
+            return _NOT_HELD_RESULT
         
         if not character:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see them here."
-            )
+            return _NOT_HERE_RESULT
         
-        if not character.has_flag(ObjectFlag.PERSON):
+        if not (character._flags & _PERSON):
             return CommandResult(
                 status=CommandStatus.FAILURE,
                 message=f"The {character.name} isn't interested."
             )
         
-        # Check if object is in inventory
-        if obj.location != self.player:
-            return CommandResult(
-                status=CommandStatus.FAILURE,
-                message="You need to be carrying it first."
-            )
-        
         # Get character's reaction to the object
         reactions = character.get_property('show_reactions', {})
         if obj.id in reactions:
@@ -187,6 +194,8 @@ class ShowCommand(Command):
 class AccuseCommand(Command):
     """Accuse someone of murder - game-winning command"""
     
+    __slots__ = ()
+    
     def can_execute(self, parse_result) -> bool:
         return parse_result.direct_object is not None
     
@@ -194,12 +203,9 @@ class AccuseCommand(Command):
         character = self.get_object(parse_result.direct_object)
         
         if not character:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see them here."
-            )
+            return _NOT_HERE_RESULT
         
-        if not character.has_flag(ObjectFlag.PERSON):
+        if not (character._flags & _PERSON):
             return CommandResult(
                 status=CommandStatus.FAILURE,
                 message="You can only accuse people."
@@ -226,9 +232,15 @@ class AccuseCommand(Command):
 class ArrestCommand(Command):
     """Arrest someone - alternative to accuse"""
     
+    __slots__ = ('_accuse',)
+    
+    def __init__(self, engine: 'GameEngine'):
+        super().__init__(engine)
+        self._accuse = AccuseCommand(engine)
+    
     def can_execute(self, parse_result) -> bool:
         return parse_result.direct_object is not None
     
     def execute(self, parse_result) -> CommandResult:
         # Arrest is functionally the same as accuse in this game
-        return AccuseCommand(self.engine).execute(parse_result)
\ No newline at end of file
+        return self._accuse.execute(parse_result)
\ No newline at end of file
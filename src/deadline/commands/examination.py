@@ -9,10 +9,93 @@ if TYPE_CHECKING:
 from .base_command import Command, CommandResult, CommandStatus
 from ..core.flags import ObjectFlag
 
+# Raw flag bits, tested against GameObject._flags
+_CONTAINER = ObjectFlag.CONTAINER.value
+_OPEN = ObjectFlag.OPEN.value
+_TRANSPARENT = ObjectFlag.TRANSPARENT.value
+_HIDDEN = ObjectFlag.HIDDEN.value
+_SEARCHED = ObjectFlag.SEARCHED.value
+_READABLE = ObjectFlag.READABLE.value
+_SEE_INSIDE_MASK = _OPEN | _TRANSPARENT
+# What GameObject.is_visible rejects for items in an open/transparent container
+_INVIS_MASK = ObjectFlag.INVISIBLE.value
+
+# Words that make "examine" describe the player
+_SELF_REFS = frozenset(('me', 'myself', 'self'))
+
+# Shared results for fixed responses; consumers treat results as read-only
+_RES_NOT_HERE = CommandResult(
+    status=CommandStatus.ERROR,
+    message="I don't see that here."
+)
+_RES_BAD_LOCATION = CommandResult(
+    status=CommandStatus.ERROR,
+    message="You're not in a valid location."
+)
+_RES_LOOKED = CommandResult(
+    status=CommandStatus.SUCCESS,
+    message="",
+    consumed_time=False  # Looking doesn't consume time
+)
+_RES_SELF = CommandResult(
+    status=CommandStatus.SUCCESS,
+    message="You're a professional detective, here to investigate the death of Marshall Robner.",
+    consumed_time=False
+)
+
+# Response templates
+_MSG_FOUND_UNDER = "Looking under the {}, you find: {}"
+_MSG_NOTHING_UNDER = "There's nothing under the {}."
+_MSG_FOUND_BEHIND = "Looking behind the {}, you find: {}"
+_MSG_NOTHING_BEHIND = "There's nothing behind the {}."
+
+# Shared empty default for list-valued properties
+_EMPTY = ()
+
+# Container description formats indexed by (OPEN << 1 | TRANSPARENT):
+# (with contents, when empty); None means nothing is added
+_CONTAINER_FMTS = (
+    (None, None),                                          # closed, opaque
+    ("\n\nThrough the {} you can see: {}", None),           # transparent
+    ("\n\nThe {} contains: {}", "\n\nThe {} is empty."),     # open
+    ("\n\nThe {} contains: {}", "\n\nThe {} is empty."),     # open, transparent
+)
+
+
+# Default for _reveal's destination: leave revealed items where they are
+_STAY = object()
+
+
+def _reveal(items, em=None, destination=_STAY) -> list:
+    """
+    Clear HIDDEN on every hidden item and return those revealed, optionally
+    moving them and collecting any that are evidence
+    """
+    found = []
+    append = found.append
+    evidence_ids = []
+    for item in items:
+        if item.test_and_clear(_HIDDEN):
+            if destination is not _STAY:
+                item.move_to(destination)
+            if item.properties.get('evidence'):
+                evidence_ids.append(item.id)
+            append(item)
+    if em is not None and evidence_ids:
+        em.collect_many(evidence_ids)
+    return found
+
+
+def _a_list(items) -> str:
+    """Format found items as "a X, a Y" (items must be non-empty)"""
+    return "a " + ", a ".join(item.name for item in items)
+
 
 class LookCommand(Command):
     """Look around - equivalent to V-LOOK"""
     
+    __slots__ = ()
+    
     def can_execute(self, parse_result) -> bool:
         return True
     
@@ -20,67 +103,53 @@ class LookCommand(Command):
         current_room = self.world.get_current_room()
         
         if not current_room:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="You're not in a valid location."
-            )
+            return _RES_BAD_LOCATION
         
         # Redisplay room description
-        from ..io.interface import GameInterface
-        interface = GameInterface(self.engine)
-        interface.display_room(current_room)
+        self.get_interface().display_room(current_room)
         
-        return CommandResult(
-            status=CommandStatus.SUCCESS,
-            message="",
-            consumed_time=False  # Looking doesn't consume time
-        )
+        return _RES_LOOKED
 
 
 class ExamineCommand(Command):
     """Examine an object - equivalent to V-EXAMINE"""
     
-    def can_execute(self, parse_result) -> bool:
-        return parse_result.direct_object is not None
+    __slots__ = ()
+    
+    requires_direct_object = True
     
     def execute(self, parse_result) -> CommandResult:
-        obj_ref = parse_result.direct_object
-        
         # Special case for "me" or "self"
-        if obj_ref.lower() in ['me', 'myself', 'self']:
-            return CommandResult(
-                status=CommandStatus.SUCCESS,
-                message="You're a professional detective, here to investigate the death of Marshall Robner.",
-                consumed_time=False
-            )
+        if parse_result.direct_object_lc in _SELF_REFS:
+            return _RES_SELF
         
-        obj = self.get_object(obj_ref)
+        obj = self.get_direct_object(parse_result)
         
         if not obj:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see that here."
-            )
+            return _RES_NOT_HERE
+        
+        name = obj.name
         
         # Get detailed description
         description = obj.get_description(detailed=True)
         
         # Check for hidden objects
-        if obj.has_flag(ObjectFlag.CONTAINER):
-            if obj.has_flag(ObjectFlag.OPEN):
-                if obj.contents:
-                    items = ", ".join([item.name for item in obj.contents if item.is_visible()])
-                    description += f"\n\nThe {obj.name} contains: {items}"
-                else:
-                    description += f"\n\nThe {obj.name} is empty."
-            elif obj.has_flag(ObjectFlag.TRANSPARENT):
-                if obj.contents:
-                    items = ", ".join([item.name for item in obj.contents if item.is_visible()])
-                    description += f"\n\nThrough the {obj.name} you can see: {items}"
+        flags = obj._flags
+        if flags & _CONTAINER and flags & _SEE_INSIDE_MASK:
+            state = ((flags & _OPEN) != 0) << 1 | ((flags & _TRANSPARENT) != 0)
+            with_contents, when_empty = _CONTAINER_FMTS[state]
+            # Only containers are worth reading contents for
+            contents = obj.contents
+            if contents:
+                # The container is open or transparent here, so is_visible()
+                # reduces to the INVISIBLE bit
+                items = ", ".join(item.name for item in contents if not item._flags & _INVIS_MASK)
+                description += with_contents.format(name, items)
+            elif when_empty:
+                description += when_empty.format(name)
         
         # Mark as evidence if examining reveals it
-        if obj.get_property('evidence') and obj.has_flag(ObjectFlag.HIDDEN):
-            obj.clear_flag(ObjectFlag.HIDDEN)
+        if obj.get_property('evidence') and obj.test_and_clear(_HIDDEN):
             self.world.evidence_manager.collect_evidence(obj.id)
             description += "\n\n[This looks like important evidence!]"
         
@@ -94,68 +163,67 @@ class ExamineCommand(Command):
 class SearchCommand(Command):
     """Search an object thoroughly - equivalent to V-SEARCH"""
     
-    def can_execute(self, parse_result) -> bool:
-        return parse_result.direct_object is not None
+    __slots__ = ()
+    
+    requires_direct_object = True
     
     def execute(self, parse_result) -> CommandResult:
-        obj = self.get_object(parse_result.direct_object)
+        obj = self.get_direct_object(parse_result)
         
         if not obj:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see that here."
-            )
+            return _RES_NOT_HERE
+        
+        name = obj.name
         
         # Check if already searched
-        if obj.has_flag(ObjectFlag.SEARCHED):
+        flags = obj._flags
+        if flags & _SEARCHED:
             return CommandResult(
                 status=CommandStatus.SUCCESS,
-                message=f"You've already thoroughly searched the {obj.name}."
+                message=f"You've already thoroughly searched the {name}."
             )
         
         # Mark as searched
-        obj.set_flag(ObjectFlag.SEARCHED)
+        obj.set_flag(_SEARCHED)
         
-        # Check for hidden items
-        found_items = []
-        for item in obj.contents:
-            if item.has_flag(ObjectFlag.HIDDEN):
-                item.clear_flag(ObjectFlag.HIDDEN)
-                found_items.append(item)
-                
-                # Collect evidence if applicable
-                if item.get_property('evidence'):
-                    self.world.evidence_manager.collect_evidence(item.id)
+        # Nothing inside means nothing hidden
+        contents = obj.contents or ()
+        if not contents:
+            return CommandResult(
+                status=CommandStatus.SUCCESS,
+                message=f"You search the {name} thoroughly but find nothing of interest."
+            )
+        
+        # Check for hidden items, collecting any evidence among them
+        found_items = _reveal(contents, self.world.evidence_manager)
         
         if found_items:
-            items_text = ", ".join([f"a {item.name}" for item in found_items])
+            items_text = _a_list(found_items)
             return CommandResult(
                 status=CommandStatus.SUCCESS,
-                message=f"Searching the {obj.name}, you find: {items_text}"
+                message=f"Searching the {name}, you find: {items_text}"
             )
         else:
             return CommandResult(
                 status=CommandStatus.SUCCESS,
-                message=f"You search the {obj.name} thoroughly but find nothing of interest."
+                message=f"You search the {name} thoroughly but find nothing of interest."
             )
 
 
 class ReadCommand(Command):
     """Read something - equivalent to V-READ"""
     
-    def can_execute(self, parse_result) -> bool:
-        return parse_result.direct_object is not None
+    __slots__ = ()
+    
+    requires_direct_object = True
     
     def execute(self, parse_result) -> CommandResult:
-        obj = self.get_object(parse_result.direct_object)
+        obj = self.get_direct_object(parse_result)
         
         if not obj:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see that here."
-            )
+            return _RES_NOT_HERE
         
-        if not obj.has_flag(ObjectFlag.READABLE):
+        if not obj.has_flag(_READABLE):
             return CommandResult(
                 status=CommandStatus.FAILURE,
                 message=f"There's nothing to read on the {obj.name}."
@@ -167,8 +235,7 @@ class ReadCommand(Command):
             text = obj.description
         
         # Mark as evidence if applicable
-        if obj.get_property('evidence') and not self.world.evidence_manager.has_evidence(obj.id):
-            self.world.evidence_manager.collect_evidence(obj.id)
+        if self.world.evidence_manager.try_collect(obj.id, obj.get_property('evidence')):
             text += "\n\n[This seems important to the case!]"
         
         return CommandResult(
@@ -178,85 +245,62 @@ class ReadCommand(Command):
         )
 
 
-class LookUnderCommand(Command):
-    """Look under something"""
+class _DirectionalLookCommand(Command):
+    """Shared logic for looking under/behind something"""
     
-    def can_execute(self, parse_result) -> bool:
-        return parse_result.direct_object is not None
+    __slots__ = ()
+    
+    requires_direct_object = True
+    
+    # Set by subclasses
+    _prop_key = ''
+    _msg_found = ''
+    _msg_nothing = ''
     
     def execute(self, parse_result) -> CommandResult:
-        obj = self.get_object(parse_result.direct_object)
+        obj = self.get_direct_object(parse_result)
         
         if not obj:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see that here."
-            )
+            return _RES_NOT_HERE
+        
+        name = obj.name
         
-        # Check for items hidden under
-        under_items = obj.get_property('under_items', [])
-        if under_items:
-            # Reveal hidden items
-            found = []
-            for item_id in under_items:
-                if item_id in self.world.objects:
-                    item = self.world.objects[item_id]
-                    if item.has_flag(ObjectFlag.HIDDEN):
-                        item.clear_flag(ObjectFlag.HIDDEN)
-                        item.move_to(obj.location)
-                        found.append(item)
+        # Check for items hidden there
+        hidden_ids = obj.get_property(self._prop_key, _EMPTY)
+        if hidden_ids:
+            # Reveal hidden items beside the object
+            objects = self.world.objects
+            items = [objects[item_id] for item_id in hidden_ids if item_id in objects]
+            found = _reveal(items, destination=obj.location)
             
             if found:
-                items_text = ", ".join([f"a {item.name}" for item in found])
                 return CommandResult(
                     status=CommandStatus.SUCCESS,
-                    message=f"Looking under the {obj.name}, you find: {items_text}"
+                    message=self._msg_found.format(name, _a_list(found))
                 )
         
         return CommandResult(
             status=CommandStatus.SUCCESS,
-            message=f"There's nothing under the {obj.name}.",
+            message=self._msg_nothing.format(name),
             consumed_time=False
         )
 
 
-class LookBehindCommand(Command):
+class LookUnderCommand(_DirectionalLookCommand):
+    """Look under something"""
+    
+    __slots__ = ()
+    
+    _prop_key = 'under_items'
+    _msg_found = _MSG_FOUND_UNDER
+    _msg_nothing = _MSG_NOTHING_UNDER
+
+
+class LookBehindCommand(_DirectionalLookCommand):
     """Look behind something"""
     
-    def can_execute(self, parse_result) -> bool:
-        return parse_result.direct_object is not None
+    __slots__ = ()
     
-    def execute(self, parse_result) -> CommandResult:
-        obj = self.get_object(parse_result.direct_object)
-        
-        if not obj:
-            return CommandResult(
-                status=CommandStatus.ERROR,
-                message="I don't see that here."
-            )
-        
-        # Check for items hidden behind
-        behind_items = obj.get_property('behind_items', [])
-        if behind_items:
-            # Reveal hidden items
-            found = []
-            for item_id in behind_items:
-                if item_id in self.world.objects:
-                    item = self.world.objects[item_id]
-                    if item.has_flag(ObjectFlag.HIDDEN):
-                        item.clear_flag(ObjectFlag.HIDDEN)
-                        item.move_to(obj.location)
-                        found.append(item)
-            
-            if found:
-                items_text = ", ".join([f"a {item.name}" for item in found])
-                return CommandResult(
-                    status=CommandStatus.SUCCESS,
-                    message=f"Looking behind the {obj.name}, you find: {items_text}"
-                )
-        
-        return CommandResult(
-            status=CommandStatus.SUCCESS,
-            message=f"There's nothing behind the {obj.name}.",
-            consumed_time=False
-        )
\ No newline at end of file
+    _prop_key = 'behind_items'
+    _msg_found = _MSG_FOUND_BEHIND
+    _msg_nothing = _MSG_NOTHING_BEHIND
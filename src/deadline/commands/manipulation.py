@@ -11,6 +11,64 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Raw flag bits, tested against GameObject._flags
+_CONTAINER = ObjectFlag.CONTAINER.value
+_OPEN = ObjectFlag.OPEN.value
+_LOCKED = ObjectFlag.LOCKED.value
+_SURFACE = ObjectFlag.SURFACE.value
+_LIGHT = ObjectFlag.LIGHT.value
+_ON = ObjectFlag.ON.value
+_WEARABLE = ObjectFlag.WEARABLE.value
+_PERSON = ObjectFlag.PERSON.value
+_SACRED = ObjectFlag.SACRED.value
+_DOOR = ObjectFlag.DOOR.value
+_LIT = _LIGHT | _ON
+
+# Shared results for fixed responses; consumers treat results as read-only
+_R_TAKE_WHAT = CommandResult.failure("Take what?")
+_R_YOURE_ALREADY_CARRYING_THAT = CommandResult.failure("You're already carrying that.")
+_R_I_DONT_SEE_THAT_HERE = CommandResult.error("I don't see that here.")
+_R_YOU_CANT_REACH_THAT = CommandResult.failure("You can't reach that.")
+_R_THATS_TOO_IMPORTANT_TO_TAKE = CommandResult.failure("That's too important to take.")
+_R_YOU_CANT_PICK_UP_PEOPLE = CommandResult.failure("You can't pick up people!")
+_R_YOU_CANT_TAKE_THAT = CommandResult.failure("You can't take that.")
+_R_THATS_TOO_HEAVY_TO_CARRY = CommandResult.failure("That's too heavy to carry.")
+_R_TAKEN = CommandResult.success("Taken.")
+_R_DROP_WHAT = CommandResult.failure("Drop what?")
+_R_YOURE_NOT_CARRYING_THAT = CommandResult.failure("You're not carrying that.")
+_R_YOU_CANT_DROP_THAT_HERE = CommandResult.failure("You can't drop that here.")
+_R_YOU_NEED_TO_TAKE_IT_OFF_FIRST = CommandResult.failure("You need to take it off first.")
+_R_YOURE_NOWHERE = CommandResult.error("You're nowhere!")
+_R_DROPPED = CommandResult.success("Dropped.")
+_R_OPEN_WHAT = CommandResult.failure("Open what?")
+_R_ITS_LOCKED = CommandResult.failure("It's locked.")
+_R_ITS_ALREADY_OPEN = CommandResult.failure("It's already open.")
+_R_YOU_CANT_OPEN_THAT = CommandResult.failure("You can't open that.")
+_R_CLOSE_WHAT = CommandResult.failure("Close what?")
+_R_ITS_ALREADY_CLOSED = CommandResult.failure("It's already closed.")
+_R_YOU_CANT_CLOSE_THAT = CommandResult.failure("You can't close that.")
+_R_LOCK_WHAT = CommandResult.failure("Lock what?")
+_R_THAT_DOESNT_HAVE_A_LOCK = CommandResult.failure("That doesn't have a lock.")
+_R_ITS_ALREADY_LOCKED = CommandResult.failure("It's already locked.")
+_R_YOU_NEED_TO_CLOSE_IT_FIRST = CommandResult.failure("You need to close it first.")
+_R_UNLOCK_WHAT = CommandResult.failure("Unlock what?")
+_R_ITS_NOT_LOCKED = CommandResult.failure("It's not locked.")
+_R_PUT_WHAT = CommandResult.failure("Put what?")
+_R_YOU_NEED_TO_TAKE_IT_FIRST = CommandResult.failure("You need to take it first.")
+_R_YOU_CANT_PUT_SOMETHING_INSIDE_ITSELF = CommandResult.failure("You can't put something inside itself!")
+_R_GIVE_WHAT = CommandResult.failure("Give what?")
+_R_YOU_DONT_HAVE_THAT = CommandResult.error("You don't have that.")
+_R_I_DONT_SEE_THEM_HERE = CommandResult.error("I don't see them here.")
+_R_WEAR_WHAT = CommandResult.failure("Wear what?")
+_R_YOU_CANT_WEAR_THAT = CommandResult.failure("You can't wear that.")
+_R_YOURE_ALREADY_WEARING_IT = CommandResult.failure("You're already wearing it.")
+_R_REMOVE_WHAT = CommandResult.failure("Remove what?")
+_R_YOURE_NOT_WEARING_THAT = CommandResult.error("You're not wearing that.")
+_R_YOURE_NOT_WEARING_THAT_FAILURE = CommandResult.failure("You're not wearing that.")
+_R_YOURE_NOT_WEARING_IT = CommandResult.failure("You're not wearing it.")
+_R_THROW_WHAT = CommandResult.failure("Throw what?")
+_R_YOURE_NOT_CARRYING_THAT_ERROR = CommandResult.error("You're not carrying that.")
+
 
 class TakeCommand(ManipulationCommand):
     """Take/get an object - equivalent to V-TAKE"""
@@ -20,7 +78,7 @@ class TakeCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Take what?")
+            return _R_TAKE_WHAT
         
         # Try to find the object
         obj = self.get_room_object(parse_result.direct_object)
@@ -28,27 +86,27 @@ class TakeCommand(ManipulationCommand):
         if not obj:
             # Check if already carried
             if self.get_held_object(parse_result.direct_object):
-                return CommandResult.failure("You're already carrying that.")
-            return CommandResult.error("I don't see that here.")
+                return _R_YOURE_ALREADY_CARRYING_THAT
+            return _R_I_DONT_SEE_THAT_HERE
         
         # Check if object is accessible
         if not obj.is_accessible():
             container = obj.location
-            if container and container.has_flag(ObjectFlag.CONTAINER):
-                if not container.has_flag(ObjectFlag.OPEN):
+            if container and container._flags & _CONTAINER:
+                if not container._flags & _OPEN:
                     return CommandResult.failure(
                         f"You need to open the {container.name} first."
                     )
-            return CommandResult.failure("You can't reach that.")
+            return _R_YOU_CANT_REACH_THAT
         
         # Check if takeable
         if not obj.can_take():
-            if obj.has_flag(ObjectFlag.SACRED):
-                return CommandResult.failure("That's too important to take.")
-            elif obj.has_flag(ObjectFlag.PERSON):
-                return CommandResult.failure("You can't pick up people!")
+            if obj._flags & _SACRED:
+                return _R_THATS_TOO_IMPORTANT_TO_TAKE
+            elif obj._flags & _PERSON:
+                return _R_YOU_CANT_PICK_UP_PEOPLE
             else:
-                return CommandResult.failure("You can't take that.")
+                return _R_YOU_CANT_TAKE_THAT
         
         # Check if player can carry it
         if not self.player.can_carry(obj):
@@ -58,7 +116,7 @@ class TakeCommand(ManipulationCommand):
                     "You're carrying too many things. Try dropping something first."
                 )
             else:
-                return CommandResult.failure("That's too heavy to carry.")
+                return _R_THATS_TOO_HEAVY_TO_CARRY
         
         # Take the object
         obj.move_to(self.player)
@@ -76,13 +134,12 @@ class TakeCommand(ManipulationCommand):
                     )
         
         # Special message for certain items
-        if obj.has_flag(ObjectFlag.LIGHT):
-            if obj.has_flag(ObjectFlag.ON):
-                return CommandResult.success(
-                    f"You take the {obj.name} (providing light)."
-                )
+        if (obj._flags & _LIT) == _LIT:
+            return CommandResult.success(
+                f"You take the {obj.name} (providing light)."
+            )
         
-        return CommandResult.success("Taken.")
+        return _R_TAKEN
 
 
 class DropCommand(ManipulationCommand):
@@ -93,38 +150,38 @@ class DropCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Drop what?")
+            return _R_DROP_WHAT
         
         obj = self.get_held_object(parse_result.direct_object)
         
         if not obj:
             # Check if it's in the room
             if self.get_room_object(parse_result.direct_object):
-                return CommandResult.failure("You're not carrying that.")
-            return CommandResult.error("I don't see that here.")
+                return _R_YOURE_NOT_CARRYING_THAT
+            return _R_I_DONT_SEE_THAT_HERE
         
         # Check if droppable
-        if obj.has_flag(ObjectFlag.SACRED):
-            return CommandResult.failure("You can't drop that here.")
+        if obj._flags & _SACRED:
+            return _R_YOU_CANT_DROP_THAT_HERE
         
         # Check if worn
-        if obj.has_flag(ObjectFlag.WEARABLE) and obj.get_property('worn'):
-            return CommandResult.failure("You need to take it off first.")
+        if obj._flags & _WEARABLE and obj.get_property('worn'):
+            return _R_YOU_NEED_TO_TAKE_IT_OFF_FIRST
         
         # Drop the object
         current_room = self.get_current_room()
         if not current_room:
-            return CommandResult.error("You're nowhere!")
+            return _R_YOURE_NOWHERE
         
         obj.move_to(current_room)
         
         # Special messages
-        if obj.has_flag(ObjectFlag.LIGHT) and obj.has_flag(ObjectFlag.ON):
+        if (obj._flags & _LIT) == _LIT:
             return CommandResult.success(
                 f"You drop the {obj.name} (still providing light)."
             )
         
-        return CommandResult.success("Dropped.")
+        return _R_DROPPED
 
 
 class OpenCommand(ManipulationCommand):
@@ -135,29 +192,30 @@ class OpenCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Open what?")
+            return _R_OPEN_WHAT
         
         obj = self.get_visible_object(parse_result.direct_object)
         
         if not obj:
-            return CommandResult.error("I don't see that here.")
+            return _R_I_DONT_SEE_THAT_HERE
         
         # Check if it can be opened
-        if not obj.has_flag(ObjectFlag.CONTAINER):
-            if hasattr(obj, '__class__') and obj.__class__.__name__ == 'Door':
+        f = obj._flags
+        if not f & _CONTAINER:
+            if f & _DOOR:
                 # Special handling for doors
-                if obj.has_flag(ObjectFlag.LOCKED):
-                    return CommandResult.failure("It's locked.")
-                if obj.has_flag(ObjectFlag.OPEN):
-                    return CommandResult.failure("It's already open.")
-                obj.set_flag(ObjectFlag.OPEN)
+                if f & _LOCKED:
+                    return _R_ITS_LOCKED
+                if f & _OPEN:
+                    return _R_ITS_ALREADY_OPEN
+                obj.set_flag(_OPEN)
                 return CommandResult.success(f"You open the {obj.name}.")
-            return CommandResult.failure("You can't open that.")
+            return _R_YOU_CANT_OPEN_THAT
         
-        if obj.has_flag(ObjectFlag.OPEN):
-            return CommandResult.failure("It's already open.")
+        if f & _OPEN:
+            return _R_ITS_ALREADY_OPEN
         
-        if obj.has_flag(ObjectFlag.LOCKED):
+        if f & _LOCKED:
             key_id = obj.get_property('key_id')
             if key_id:
                 # Check if player has the key
@@ -166,17 +224,15 @@ class OpenCommand(ManipulationCommand):
                     return CommandResult.failure(
                         f"It's locked. Try unlocking it with the {key.name}."
                     )
-            return CommandResult.failure("It's locked.")
+            return _R_ITS_LOCKED
         
         # Open it
-        obj.set_flag(ObjectFlag.OPEN)
+        obj.set_flag(_OPEN)
         
         # Describe contents if any
         if obj.contents:
-            visible_contents = [item for item in obj.contents if item.is_visible()]
-            if visible_contents:
-                items = ", ".join([item.get_inventory_description() 
-                                 for item in visible_contents])
+            items = obj._visible_desc()
+            if items:
                 message = f"You open the {obj.name}, revealing: {items}."
             else:
                 message = f"You open the {obj.name}."
@@ -194,28 +250,29 @@ class CloseCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Close what?")
+            return _R_CLOSE_WHAT
         
         obj = self.get_visible_object(parse_result.direct_object)
         
         if not obj:
-            return CommandResult.error("I don't see that here.")
+            return _R_I_DONT_SEE_THAT_HERE
         
         # Check if it can be closed
-        if not obj.has_flag(ObjectFlag.CONTAINER):
-            if hasattr(obj, '__class__') and obj.__class__.__name__ == 'Door':
+        f = obj._flags
+        if not f & _CONTAINER:
+            if f & _DOOR:
                 # Special handling for doors
-                if not obj.has_flag(ObjectFlag.OPEN):
-                    return CommandResult.failure("It's already closed.")
-                obj.clear_flag(ObjectFlag.OPEN)
+                if not f & _OPEN:
+                    return _R_ITS_ALREADY_CLOSED
+                obj.clear_flag(_OPEN)
                 return CommandResult.success(f"You close the {obj.name}.")
-            return CommandResult.failure("You can't close that.")
+            return _R_YOU_CANT_CLOSE_THAT
         
-        if not obj.has_flag(ObjectFlag.OPEN):
-            return CommandResult.failure("It's already closed.")
+        if not f & _OPEN:
+            return _R_ITS_ALREADY_CLOSED
         
         # Close it
-        obj.clear_flag(ObjectFlag.OPEN)
+        obj.clear_flag(_OPEN)
         
         return CommandResult.success(f"You close the {obj.name}.")
 
@@ -228,52 +285,32 @@ class LockCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Lock what?")
+            return _R_LOCK_WHAT
         
         obj = self.get_visible_object(parse_result.direct_object)
         
         if not obj:
-            return CommandResult.error("I don't see that here.")
+            return _R_I_DONT_SEE_THAT_HERE
         
         # Check if it can be locked
         key_id = obj.get_property('key_id')
         if not key_id:
-            return CommandResult.failure("That doesn't have a lock.")
+            return _R_THAT_DOESNT_HAVE_A_LOCK
         
         # Check if player has the key
-        key = None
-        if parse_result.indirect_object:
-            # Key specified in command
-            key = self.get_held_object(parse_result.indirect_object)
-            if not key:
-                return CommandResult.failure(
-                    f"You don't have the {parse_result.indirect_object}."
-                )
-            if key.id != key_id:
-                return CommandResult.failure(f"The {key.name} doesn't fit.")
-        else:
-            # Look for the right key
-            key = self.get_held_object(key_id)
-            if not key:
-                # Try to find key by name
-                for item in self.player.contents:
-                    if item.id == key_id:
-                        key = item
-                        break
-                
-                if not key:
-                    return CommandResult.failure(
-                        f"You need the right key to lock the {obj.name}."
-                    )
+        key, err = self._resolve_key(parse_result, key_id, 'lock', obj.name)
+        if err:
+            return err
         
-        if obj.has_flag(ObjectFlag.LOCKED):
-            return CommandResult.failure("It's already locked.")
+        f = obj._flags
+        if f & _LOCKED:
+            return _R_ITS_ALREADY_LOCKED
         
-        if obj.has_flag(ObjectFlag.OPEN):
-            return CommandResult.failure("You need to close it first.")
+        if f & _OPEN:
+            return _R_YOU_NEED_TO_CLOSE_IT_FIRST
         
         # Lock it
-        obj.set_flag(ObjectFlag.LOCKED)
+        obj.set_flag(_LOCKED)
         
         return CommandResult.success(f"You lock the {obj.name} with the {key.name}.")
 
@@ -286,65 +323,42 @@ class UnlockCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Unlock what?")
+            return _R_UNLOCK_WHAT
         
         obj = self.get_visible_object(parse_result.direct_object)
         
         if not obj:
-            return CommandResult.error("I don't see that here.")
+            return _R_I_DONT_SEE_THAT_HERE
         
-        if not obj.has_flag(ObjectFlag.LOCKED):
-            if obj.has_flag(ObjectFlag.CONTAINER) or \
-               (hasattr(obj, '__class__') and obj.__class__.__name__ == 'Door'):
-                return CommandResult.failure("It's not locked.")
-            return CommandResult.failure("That doesn't have a lock.")
+        f = obj._flags
+        if not f & _LOCKED:
+            if f & (_CONTAINER | _DOOR):
+                return _R_ITS_NOT_LOCKED
+            return _R_THAT_DOESNT_HAVE_A_LOCK
         
         # Check for key
         key_id = obj.get_property('key_id')
         if not key_id:
             # Shouldn't happen if object is locked, but check anyway
-            obj.clear_flag(ObjectFlag.LOCKED)
+            obj.clear_flag(_LOCKED)
             return CommandResult.success(f"You unlock the {obj.name}.")
         
         # Find the key
-        key = None
-        if parse_result.indirect_object:
-            # Key specified in command
-            key = self.get_held_object(parse_result.indirect_object)
-            if not key:
-                return CommandResult.failure(
-                    f"You don't have the {parse_result.indirect_object}."
-                )
-            if key.id != key_id:
-                return CommandResult.failure(f"The {key.name} doesn't fit.")
-        else:
-            # Look for the right key
-            key = self.get_held_object(key_id)
-            if not key:
-                # Try to find key by checking all inventory items
-                for item in self.player.contents:
-                    if item.id == key_id:
-                        key = item
-                        break
-                
-                if not key:
-                    return CommandResult.failure(
-                        f"You need the right key to unlock the {obj.name}."
-                    )
+        key, err = self._resolve_key(parse_result, key_id, 'unlock', obj.name)
+        if err:
+            return err
         
         # Unlock it
-        obj.clear_flag(ObjectFlag.LOCKED)
+        obj.clear_flag(_LOCKED)
         
         # Auto-open containers after unlocking (common IF convention)
-        if obj.has_flag(ObjectFlag.CONTAINER) and not obj.has_flag(ObjectFlag.OPEN):
-            obj.set_flag(ObjectFlag.OPEN)
+        if (obj._flags & (_CONTAINER | _OPEN)) == _CONTAINER:
+            obj.set_flag(_OPEN)
             
             # Check contents
             if obj.contents:
-                visible_contents = [item for item in obj.contents if item.is_visible()]
-                if visible_contents:
-                    items = ", ".join([item.get_inventory_description() 
-                                     for item in visible_contents])
+                items = obj._visible_desc()
+                if items:
                     return CommandResult.success(
                         f"You unlock and open the {obj.name} with the {key.name}, "
                         f"revealing: {items}."
@@ -364,50 +378,48 @@ class PutCommand(ManipulationCommand):
         return parse_result.direct_object is not None
     
     def execute(self, parse_result):
-        if not parse_result.direct_object:
-            return CommandResult.failure("Put what?")
+        do, io = parse_result.direct_object, parse_result.indirect_object
+        if not do:
+            return _R_PUT_WHAT
         
-        if not parse_result.indirect_object:
-            return CommandResult.failure(f"Put the {parse_result.direct_object} where?")
+        if not io:
+            return CommandResult.failure(f"Put the {do} where?")
         
         # Get the object to put
-        obj = self.get_held_object(parse_result.direct_object)
+        obj = self.get_held_object(do)
         if not obj:
-            obj = self.get_room_object(parse_result.direct_object)
+            obj = self.get_room_object(do)
             if not obj:
-                return CommandResult.error("I don't see that here.")
+                return _R_I_DONT_SEE_THAT_HERE
             if obj.location != self.player:
-                return CommandResult.failure("You need to take it first.")
+                return _R_YOU_NEED_TO_TAKE_IT_FIRST
         
         # Get the container
-        container = self.get_visible_object(parse_result.indirect_object)
+        container = self.get_visible_object(io)
         if not container:
-            return CommandResult.error(
-                f"I don't see the {parse_result.indirect_object} here."
-            )
+            return CommandResult.error(f"I don't see the {io} here.")
         
         # Can't put something in itself
         if obj == container:
-            return CommandResult.failure("You can't put something inside itself!")
+            return _R_YOU_CANT_PUT_SOMETHING_INSIDE_ITSELF
         
         # Check if container can hold objects
-        if not container.has_flag(ObjectFlag.CONTAINER) and \
-           not container.has_flag(ObjectFlag.SURFACE):
+        cf = container._flags
+        if not cf & (_CONTAINER | _SURFACE):
             return CommandResult.failure(
                 f"You can't put things in the {container.name}."
             )
         
         # Check if container is open
-        if container.has_flag(ObjectFlag.CONTAINER):
-            if not container.has_flag(ObjectFlag.OPEN):
+        if cf & _CONTAINER:
+            if not cf & _OPEN:
                 return CommandResult.failure(
                     f"The {container.name} is closed."
                 )
         
         # Check capacity
         if not container.can_contain(obj):
-            capacity = container.get_property('capacity')
-            if capacity and len(container.contents) >= capacity:
+            if len(container.contents) >= container.capacity:
                 return CommandResult.failure(
                     f"The {container.name} is full."
                 )
@@ -420,7 +432,7 @@ class PutCommand(ManipulationCommand):
         obj.move_to(container)
         
         # Determine preposition
-        if container.has_flag(ObjectFlag.SURFACE):
+        if cf & _SURFACE:
             prep = "on"
         else:
             prep = "in"
@@ -437,26 +449,27 @@ class GiveCommand(ManipulationCommand):
         return parse_result.direct_object is not None
     
     def execute(self, parse_result):
-        if not parse_result.direct_object:
-            return CommandResult.failure("Give what?")
+        do, io = parse_result.direct_object, parse_result.indirect_object
+        if not do:
+            return _R_GIVE_WHAT
         
-        if not parse_result.indirect_object:
-            return CommandResult.failure(f"Give the {parse_result.direct_object} to whom?")
+        if not io:
+            return CommandResult.failure(f"Give the {do} to whom?")
         
         # Get the object to give
-        obj = self.get_held_object(parse_result.direct_object)
+        obj = self.get_held_object(do)
         if not obj:
-            if self.get_room_object(parse_result.direct_object):
-                return CommandResult.failure("You need to take it first.")
-            return CommandResult.error("You don't have that.")
+            if self.get_room_object(do):
+                return _R_YOU_NEED_TO_TAKE_IT_FIRST
+            return _R_YOU_DONT_HAVE_THAT
         
         # Get the recipient
-        recipient = self.get_room_object(parse_result.indirect_object)
+        recipient = self.get_room_object(io)
         if not recipient:
-            return CommandResult.error("I don't see them here.")
+            return _R_I_DONT_SEE_THEM_HERE
         
         # Check if recipient is a person
-        if not recipient.has_flag(ObjectFlag.PERSON):
+        if not recipient._flags & _PERSON:
             return CommandResult.failure(
                 f"You can only give things to people, not to the {recipient.name}."
             )
@@ -467,18 +480,18 @@ class GiveCommand(ManipulationCommand):
             reaction = recipient.react_to_action('give', obj)
             
             # Check if character refuses the item
-            if recipient.get_property('refuses_items'):
-                refused = recipient.get_property('refuses_items')
+            refused = recipient.properties.get('refuses_items')
+            if refused:
                 if obj.id in refused or 'all' in refused:
                     return CommandResult.failure(
                         reaction or f"{recipient.name} doesn't want the {obj.name}."
                     )
             
             # Special handling for evidence
-            if obj.get_property('evidence'):
+            props = obj.properties
+            if props.get('evidence'):
                 # Character might reveal information when given evidence
-                trust_change = obj.get_property('evidence_value', 0) // 5
-                recipient.trust_level = recipient.trust_level + trust_change
+                recipient.trust_level += props.get('evidence_value', 0) // 5
                 
                 # Move object to character
                 obj.move_to(recipient)
@@ -513,30 +526,28 @@ class WearCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Wear what?")
+            return _R_WEAR_WHAT
         
         obj = self.get_held_object(parse_result.direct_object)
         if not obj:
             obj = self.get_room_object(parse_result.direct_object)
             if obj:
-                return CommandResult.failure("You need to take it first.")
-            return CommandResult.error("I don't see that here.")
+                return _R_YOU_NEED_TO_TAKE_IT_FIRST
+            return _R_I_DONT_SEE_THAT_HERE
         
-        if not obj.has_flag(ObjectFlag.WEARABLE):
-            return CommandResult.failure("You can't wear that.")
+        if not obj._flags & _WEARABLE:
+            return _R_YOU_CANT_WEAR_THAT
         
         if obj.get_property('worn'):
-            return CommandResult.failure("You're already wearing it.")
+            return _R_YOURE_ALREADY_WEARING_IT
         
         # Check for conflicting worn items
         worn_type = obj.get_property('wear_type', 'clothing')
-        for item in self.player.contents:
-            if item != obj and item.has_flag(ObjectFlag.WEARABLE):
-                if item.get_property('worn') and \
-                   item.get_property('wear_type', 'clothing') == worn_type:
-                    return CommandResult.failure(
-                        f"You're already wearing the {item.name}."
-                    )
+        item = self.player._worn_by_type.get(worn_type)
+        if item is not None and item is not obj and item._flags & _WEARABLE:
+            return CommandResult.failure(
+                f"You're already wearing the {item.name}."
+            )
         
         obj.set_property('worn', True)
         return CommandResult.success(f"You put on the {obj.name}.")
@@ -550,17 +561,17 @@ class RemoveCommand(ManipulationCommand):
     
     def execute(self, parse_result):
         if not parse_result.direct_object:
-            return CommandResult.failure("Remove what?")
+            return _R_REMOVE_WHAT
         
         obj = self.get_held_object(parse_result.direct_object)
         if not obj:
-            return CommandResult.error("You're not wearing that.")
+            return _R_YOURE_NOT_WEARING_THAT
         
-        if not obj.has_flag(ObjectFlag.WEARABLE):
-            return CommandResult.failure("You're not wearing that.")
+        if not obj._flags & _WEARABLE:
+            return _R_YOURE_NOT_WEARING_THAT_FAILURE
         
         if not obj.get_property('worn'):
-            return CommandResult.failure("You're not wearing it.")
+            return _R_YOURE_NOT_WEARING_IT
         
         obj.set_property('worn', False)
         return CommandResult.success(f"You take off the {obj.name}.")
@@ -573,23 +584,22 @@ class ThrowCommand(ManipulationCommand):
         return parse_result.direct_object is not None
     
     def execute(self, parse_result):
-        if not parse_result.direct_object:
-            return CommandResult.failure("Throw what?")
+        do, io = parse_result.direct_object, parse_result.indirect_object
+        if not do:
+            return _R_THROW_WHAT
         
-        obj = self.get_held_object(parse_result.direct_object)
+        obj = self.get_held_object(do)
         if not obj:
-            return CommandResult.error("You're not carrying that.")
+            return _R_YOURE_NOT_CARRYING_THAT_ERROR
         
         # If target specified
-        if parse_result.indirect_object:
-            target = self.get_visible_object(parse_result.indirect_object)
+        if io:
+            target = self.get_visible_object(io)
             if not target:
-                return CommandResult.error(
-                    f"I don't see the {parse_result.indirect_object} here."
-                )
+                return CommandResult.error(f"I don't see the {io} here.")
             
             # Check if throwing at a person
-            if target.has_flag(ObjectFlag.PERSON):
+            if target._flags & _PERSON:
                 # Drop the object
                 room = self.get_current_room()
                 obj.move_to(room)
@@ -610,7 +620,7 @@ class ThrowCommand(ManipulationCommand):
                 obj.move_to(room)
                 
                 # Check if target breaks
-                if target.get_property('fragile'):
+                if target.properties.get('fragile'):
                     return CommandResult.success(
                         f"You throw the {obj.name} at the {target.name}. "
                         f"The {target.name} shatters!"
@@ -626,7 +636,7 @@ class ThrowCommand(ManipulationCommand):
         obj.move_to(room)
         
         # Check if object breaks
-        if obj.get_property('fragile'):
+        if obj.properties.get('fragile'):
             obj.set_property('broken', True)
             return CommandResult.success(
                 f"You throw the {obj.name} to the ground. It shatters!"
@@ -2,6 +2,7 @@
 """
 Meta commands - save, load, quit, inventory, etc.
 """
+import re
 from typing import TYPE_CHECKING, List
 if TYPE_CHECKING:
     from ..parser.parser import ParseResult
@@ -9,6 +10,69 @@ if TYPE_CHECKING:
 from .base_command import Command, CommandResult, CommandStatus
 from ..core.game_engine import GameState
 
+# WAIT durations: "10", "10 minutes", "10 mins", "1 hour", "2 hours"
+_WAIT_RE = re.compile(r'(\d+)\s*(hour|minute|min)?s?')
+
+# Help text never changes; build the result once (treated as read-only)
+_HELP_RESULT = CommandResult(
+    status=CommandStatus.SUCCESS,
+    message="""DEADLINE - Command Reference
+
+Movement:
+  GO [direction] or just [direction] - Move in a direction
+  ENTER [object] - Enter something
+  EXIT - Leave current location
+
+Examination:
+  LOOK or L - Look around
+  EXAMINE [object] or X [object] - Examine something closely
+  SEARCH [object] - Search something thoroughly
+  READ [object] - Read something
+  LOOK UNDER/BEHIND [object] - Look under or behind something
+
+Manipulation:
+  TAKE/GET [object] - Pick up an object
+  DROP [object] - Drop an object
+  OPEN/CLOSE [object] - Open or close something
+  LOCK/UNLOCK [object] WITH [key] - Lock or unlock something
+  PUT [object] IN/ON [container] - Put object in/on something
+
+Communication:
+  TALK TO [person] - Talk to someone
+  ASK [person] ABOUT [topic] - Ask about something
+  TELL [person] ABOUT [topic] - Tell someone something
+  SHOW [object] TO [person] - Show something to someone
+  ACCUSE [person] - Accuse someone of murder
+
+Meta Commands:
+  INVENTORY or I - Show what you're carrying
+  SCORE - Show your score
+  SAVE [filename] - Save the game
+  LOAD/RESTORE [filename] - Load a saved game
+  WAIT [minutes] - Wait for time to pass
+  QUIT - Quit the game
+  HELP - Show this help
+  ABOUT - About this game
+
+Tips:
+- Examine everything carefully for clues
+- Talk to everyone and ask about suspicious topics
+- Time passes with each action - NPCs follow schedules
+- Collect evidence before making an accusation
+- Save your game frequently""",
+    consumed_time=False
+)
+
+_ABOUT_RESULT = CommandResult(
+    status=CommandStatus.SUCCESS,
+    message="""DEADLINE: An Interactive Detective Story
+Originally written by Marc Blank, Infocom, 1982
+
+You have twelve hours to find out who killed Marshall Robner.
+Type HELP for a list of commands.""",
+    consumed_time=False
+)
+
 
 class SaveCommand(Command):
     """Save the game - equivalent to V-SAVE"""
@@ -54,7 +118,7 @@ class LoadCommand(Command):
         
         if not filename:
             # List available saves
-            saves = self.engine.save_manager.list_saves()
+            saves = self.engine.get_save_manager().list_saves()
             if saves:
                 save_list = "\n".join([f"  - {s['filename']}" for s in saves])
                 return CommandResult(
@@ -75,9 +139,7 @@ class LoadCommand(Command):
                 # Redisplay current room
                 current_room = self.world.get_current_room()
                 if current_room:
-                    from ..io.interface import GameInterface
-                    interface = GameInterface(self.engine)
-                    interface.display_room(current_room)
+                    self.get_interface().display_room(current_room)
                 
                 return CommandResult(
                     status=CommandStatus.SUCCESS,
@@ -107,10 +169,7 @@ class QuitCommand(Command):
     
     def execute(self, parse_result) -> CommandResult:
         # Confirm quit
-        from ..io.interface import GameInterface
-        interface = GameInterface(self.engine)
-        
-        if interface.confirm("Are you sure you want to quit?"):
+        if self.get_interface().confirm("Are you sure you want to quit?"):
             self.engine.state = GameState.QUIT
             return CommandResult(
                 status=CommandStatus.SUCCESS,
@@ -138,10 +197,9 @@ class InventoryCommand(Command):
         if not inventory:
             message = "You are carrying nothing."
         else:
-            items = []
-            for item in inventory:
-                items.append(f"  {item.get_inventory_description()}")
-            message = "You are carrying:\n" + "\n".join(items)
+            message = "You are carrying:\n" + "\n".join(
+                [f"  {item.get_inventory_description()}" for item in inventory]
+            )
         
         return CommandResult(
             status=CommandStatus.SUCCESS,
@@ -161,12 +219,14 @@ class ScoreCommand(Command):
         max_score = self.engine.config.max_score
         moves = self.engine.moves
         
-        message = f"Your score is {score} out of {max_score} in {moves} moves."
-        
         # Add evidence count
         evidence_count = self.world.evidence_manager.get_evidence_count()
-        if evidence_count > 0:
-            message += f"\nYou have collected {evidence_count} pieces of evidence."
+        message = (
+            f"Your score is {score} out of {max_score} in {moves} moves."
+            f"\nYou have collected {evidence_count} pieces of evidence."
+            if evidence_count > 0 else
+            f"Your score is {score} out of {max_score} in {moves} moves."
+        )
         
         return CommandResult(
             status=CommandStatus.SUCCESS,
@@ -182,33 +242,21 @@ class WaitCommand(Command):
         return True
     
     def execute(self, parse_result) -> CommandResult:
-        # Check for specific wait duration
-        if parse_result.text:
-            try:
-                # Parse duration (e.g., "10 minutes", "1 hour")
-                duration_text = parse_result.text.lower()
-                if "hour" in duration_text:
-                    hours = int(duration_text.split()[0])
-                    minutes = hours * 60
-                elif "minute" in duration_text:
-                    minutes = int(duration_text.split()[0])
-                else:
-                    minutes = int(duration_text)
-                
-                self.engine.time_manager.wait_for_duration(minutes)
-                message = f"You wait for {minutes} minutes."
-                
-            except:
-                # Default wait
-                minutes = 3
-                self.engine.time_manager.wait_for_duration(minutes)
-                message = "Time passes..."
+        # Check for specific wait duration (e.g., "10 minutes", "1 hour")
+        text = parse_result.text
+        match = _WAIT_RE.fullmatch(text.strip().lower()) if text else None
+        if match:
+            minutes = int(match.group(1))
+            if match.group(2) == 'hour':
+                minutes *= 60
+            message = f"You wait for {minutes} minutes."
         else:
             # Default wait is 3 minutes
             minutes = 3
-            self.engine.time_manager.wait_for_duration(minutes)
             message = "Time passes..."
         
+        self.engine.time_manager.wait_for_duration(minutes)
+        
         return CommandResult(
             status=CommandStatus.SUCCESS,
             message=message,
@@ -223,57 +271,17 @@ class HelpCommand(Command):
         return True
     
     def execute(self, parse_result) -> CommandResult:
-        help_text = """
-DEADLINE - Command Reference
-
-Movement:
-  GO [direction] or just [direction] - Move in a direction
-  ENTER [object] - Enter something
-  EXIT - Leave current location
-
-Examination:
-  LOOK or L - Look around
-  EXAMINE [object] or X [object] - Examine something closely
-  SEARCH [object] - Search something thoroughly
-  READ [object] - Read something
-  LOOK UNDER/BEHIND [object] - Look under or behind something
-
-Manipulation:
-  TAKE/GET [object] - Pick up an object
-  DROP [object] - Drop an object
-  OPEN/CLOSE [object] - Open or close something
-  LOCK/UNLOCK [object] WITH [key] - Lock or unlock something
-  PUT [object] IN/ON [container] - Put object in/on something
-
-Communication:
-  TALK TO [person] - Talk to someone
-  ASK [person] ABOUT [topic] - Ask about something
-  TELL [person] ABOUT [topic] - Tell someone something
-  SHOW [object] TO [person] - Show something to someone
-  ACCUSE [person] - Accuse someone of murder
+        return _HELP_RESULT
 
-Meta Commands:
-  INVENTORY or I - Show what you're carrying
-  SCORE - Show your score
-  SAVE [filename] - Save the game
-  LOAD/RESTORE [filename] - Load a saved game
-  WAIT [minutes] - Wait for time to pass
-  QUIT - Quit the game
-  HELP - Show this help
 
-Tips:
-- Examine everything carefully for clues
-- Talk to everyone and ask about suspicious topics
-- Time passes with each action - NPCs follow schedules
-- Collect evidence before making an accusation
-- Save your game frequently
-        """
-        
-        return CommandResult(
-            status=CommandStatus.SUCCESS,
-            message=help_text.strip(),
-            consumed_time=False
-        )
+class AboutCommand(Command):
+    """Show game credits - equivalent to V-INFO"""
+    
+    def can_execute(self, parse_result) -> bool:
+        return True
+    
+    def execute(self, parse_result) -> CommandResult:
+        return _ABOUT_RESULT
 
 
 class AnalyzeCommand(Command):
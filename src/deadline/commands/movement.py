@@ -2,6 +2,7 @@
 """
 Movement commands - navigation through the game world
 """
+from collections import namedtuple
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..parser.parser import ParseResult
@@ -9,6 +10,23 @@ if TYPE_CHECKING:
 from .base_command import Command, CommandResult, CommandStatus
 from ..core.flags import ObjectFlag
 
+# Raw flag bits, tested against GameObject._flags
+_CONTAINER = ObjectFlag.CONTAINER.value
+_OPEN = ObjectFlag.OPEN.value
+_VEH_OR_CONT = (ObjectFlag.VEHICLE | ObjectFlag.CONTAINER).value
+
+# Abbreviated directions -> full names
+_DIRECTION_MAP = {
+    'n': 'north', 's': 'south', 'e': 'east', 'w': 'west',
+    'ne': 'northeast', 'nw': 'northwest', 'se': 'southeast', 'sw': 'southwest',
+    'u': 'up', 'd': 'down'
+}
+
+# Stand-in parse results for the bare ENTER/EXIT fallbacks
+_DirectionOnly = namedtuple('_DirectionOnly', ['direct_object'])
+_IN = _DirectionOnly('in')
+_OUT = _DirectionOnly('out')
+
 
 class GoCommand(Command):
     """Go in a direction - equivalent to V-WALK"""
@@ -19,14 +37,9 @@ class GoCommand(Command):
     def execute(self, parse_result) -> CommandResult:
         direction = parse_result.direct_object
         
-        # Normalize direction
-        direction_map = {
-            'n': 'north', 's': 'south', 'e': 'east', 'w': 'west',
-            'ne': 'northeast', 'nw': 'northwest', 'se': 'southeast', 'sw': 'southwest',
-            'u': 'up', 'd': 'down'
-        }
-        
-        direction = direction_map.get(direction, direction)
+        # Normalize direction; only one- and two-letter forms are abbreviations
+        if len(direction) <= 2:
+            direction = _DIRECTION_MAP.get(direction, direction)
         
         # Try to move
         success, message = self.world.move_player(direction)
@@ -36,9 +49,7 @@ class GoCommand(Command):
             new_room = self.world.get_current_room()
             if new_room:
                 # Build room description
-                from ..io.interface import GameInterface
-                interface = GameInterface(self.engine)
-                interface.display_room(new_room)
+                self.get_interface().display_room(new_room)
                 
                 return CommandResult(
                     status=CommandStatus.SUCCESS,
@@ -51,7 +62,17 @@ class GoCommand(Command):
         )
 
 
-class EnterCommand(Command):
+class _FallsBackToGoCommand(Command):
+    """Base for commands that fall back to walking in a fixed direction"""
+    
+    __slots__ = ('_go',)
+    
+    def __init__(self, engine):
+        super().__init__(engine)
+        self._go = GoCommand(engine)
+
+
+class EnterCommand(_FallsBackToGoCommand):
     """Enter something - equivalent to V-ENTER"""
     
     def can_execute(self, parse_result) -> bool:
@@ -67,8 +88,10 @@ class EnterCommand(Command):
                     message="I don't see that here."
                 )
             
-            if obj.has_flag(ObjectFlag.VEHICLE) or obj.has_flag(ObjectFlag.CONTAINER):
-                if obj.has_flag(ObjectFlag.OPEN) or not obj.has_flag(ObjectFlag.CONTAINER):
+            f = obj._flags
+            if f & _VEH_OR_CONT:
+                # Open containers and non-container vehicles can be entered
+                if (f & (_CONTAINER | _OPEN)) != _CONTAINER:
                     # Enter the object
                     self.player.move_to(obj)
                     return CommandResult(
@@ -87,12 +110,10 @@ class EnterCommand(Command):
                 )
         else:
             # Generic enter - try to go "in"
-            return GoCommand(self.engine).execute(
-                type('ParseResult', (), {'direct_object': 'in'})()
-            )
+            return self._go.execute(_IN)
 
 
-class ExitCommand(Command):
+class ExitCommand(_FallsBackToGoCommand):
     """Exit/leave current location - equivalent to V-EXIT"""
     
     def can_execute(self, parse_result) -> bool:
@@ -113,6 +134,4 @@ class ExitCommand(Command):
                 )
         
         # Try to go "out"
-        return GoCommand(self.engine).execute(
-            type('ParseResult', (), {'direct_object': 'out'})()
-        )
\ No newline at end of file
+        return self._go.execute(_OUT)
\ No newline at end of file
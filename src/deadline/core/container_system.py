@@ -3,6 +3,8 @@
 Container and containment system - translated from ZIL containment
 """
 
+from collections import deque
+from sys import intern
 from typing import List, Optional, Set, TYPE_CHECKING
 from .flags import ObjectFlag
 from typing import Dict
@@ -10,46 +12,65 @@ from typing import Dict
 if TYPE_CHECKING:
     from .game_object import GameObject
 
+# Raw flag bits, tested against GameObject._flags
+_HOLDS = (ObjectFlag.CONTAINER | ObjectFlag.SURFACE).value
+_SHUT_MASK = (ObjectFlag.CONTAINER | ObjectFlag.OPEN | ObjectFlag.LOCKED).value
+_LOCKED_SHUT = (ObjectFlag.CONTAINER | ObjectFlag.LOCKED).value
+
 class ContainerSystem:
     """
     Manages object containment relationships
     Equivalent to ZIL's IN/CONTAINS system
+    
+    An object is listed in exactly one container's contents: the one
+    recorded for it in _locations (absent when it is nowhere)
     """
     
     def __init__(self):
-        self._contents: Dict[str, List[str]] = {}
-        self._locations: Dict[str, Optional[str]] = {}
+        # Insertion-ordered dicts used as ordered sets of object ids
+        self._contents: Dict[str, Dict[str, None]] = {}
+        # Objects with no container have no entry at all
+        self._locations: Dict[str, str] = {}
+        # Ids whose contents are currently non-empty; everything else is a leaf
+        self._containers: Set[str] = set()
     
     def add_to_container(self, obj_id: str, container_id: str):
         """Add an object to a container"""
+        # Interned ids let dict probes succeed on identity
+        obj_id, container_id = intern(obj_id), intern(container_id)
+        contents = self._contents
+        
         # Remove from previous container
-        if obj_id in self._locations:
-            old_container = self._locations[obj_id]
-            if old_container and old_container in self._contents:
-                if obj_id in self._contents[old_container]:
-                    self._contents[old_container].remove(obj_id)
+        old_container = self._locations.get(obj_id)
+        if old_container:
+            self._discard(old_container, obj_id)
         
         # Add to new container
-        if container_id not in self._contents:
-            self._contents[container_id] = []
-        
-        if obj_id not in self._contents[container_id]:
-            self._contents[container_id].append(obj_id)
+        new_contents = contents.get(container_id)
+        if new_contents is None:
+            new_contents = contents[container_id] = {}
+        new_contents[obj_id] = None
+        self._containers.add(container_id)
         
         self._locations[obj_id] = container_id
     
+    def _discard(self, container_id: str, obj_id: str):
+        """Drop obj_id from a container's contents, noting when it empties"""
+        contents = self._contents.get(container_id)
+        if contents:
+            contents.pop(obj_id, None)
+            if not contents:
+                self._containers.discard(container_id)
+    
     def remove_from_container(self, obj_id: str):
         """Remove an object from its container"""
-        if obj_id in self._locations:
-            container_id = self._locations[obj_id]
-            if container_id and container_id in self._contents:
-                if obj_id in self._contents[container_id]:
-                    self._contents[container_id].remove(obj_id)
-            self._locations[obj_id] = None
+        container_id = self._locations.pop(obj_id, None)
+        if container_id:
+            self._discard(container_id, obj_id)
     
     def get_contents(self, container_id: str) -> List[str]:
         """Get all objects in a container"""
-        return self._contents.get(container_id, []).copy()
+        return list(self._contents.get(container_id, ()))
     
     def get_location(self, obj_id: str) -> Optional[str]:
         """Get the container of an object"""
@@ -60,7 +81,8 @@ class ContainerSystem:
         Check if an object is in a container
         Equivalent to ZIL's IN?
         """
-        current_location = self._locations.get(obj_id)
+        get_location = self._locations.get
+        current_location = get_location(obj_id)
         
         while current_location:
             if current_location == container_id:
@@ -70,7 +92,7 @@ class ContainerSystem:
                 break
             
             # Check parent container
-            current_location = self._locations.get(current_location)
+            current_location = get_location(current_location)
         
         return False
     
@@ -79,62 +101,74 @@ class ContainerSystem:
         Get all contents, optionally recursive
         Equivalent to ZIL's FIRST?/NEXT? iteration
         """
-        result = []
-        direct_contents = self._contents.get(container_id, [])
-        result.extend(direct_contents)
+        contents = self._contents
+        direct_contents = contents.get(container_id)
+        if not direct_contents:
+            return []
+        if not recursive:
+            return list(direct_contents)
         
-        if recursive:
-            for obj_id in direct_contents:
-                result.extend(self.get_all_contents(obj_id, recursive=True))
+        # Breadth-first walk; one result list instead of one per level.
+        # Leaves (most objects) are recognised by the set and never probed.
+        containers = self._containers
+        result = []
+        append = result.append
+        pending = deque(direct_contents)
+        while pending:
+            obj_id = pending.popleft()
+            append(obj_id)
+            if obj_id in containers:
+                pending.extend(contents[obj_id])
         
         return result
     
     def find_containers_with(self, obj_id: str) -> List[str]:
         """Find all containers that contain a specific object"""
-        containers = []
-        for container_id, contents in self._contents.items():
-            if obj_id in contents:
-                containers.append(container_id)
-        return containers
+        # Single-parent invariant: the recorded location is the only one
+        location = self._locations.get(obj_id)
+        return [location] if location is not None else []
     
     def clear_container(self, container_id: str):
         """Remove all objects from a container"""
-        if container_id in self._contents:
-            for obj_id in self._contents[container_id].copy():
-                self._locations[obj_id] = None
-            self._contents[container_id].clear()
+        contents = self._contents.get(container_id)
+        if contents:
+            pop_location = self._locations.pop
+            for obj_id in contents:
+                pop_location(obj_id, None)
+            contents.clear()
+            self._containers.discard(container_id)
     
     def can_contain(self, container: 'GameObject', obj: 'GameObject') -> bool:
         """
         Check if a container can hold an object
-        Considers capacity, size, and flags
+        Considers capacity, size, and flags; cheapest checks first
         """
-        # Check if it's a container or surface
-        if not (container.has_flag(ObjectFlag.CONTAINER) or container.has_flag(ObjectFlag.SURFACE)):
+        container_id, obj_id = container.id, obj.id
+        
+        # Can't contain itself
+        if container_id == obj_id:
             return False
         
-        # Check if container is open (if applicable)
-        if container.has_flag(ObjectFlag.CONTAINER) and not container.has_flag(ObjectFlag.OPEN):
-            if container.has_flag(ObjectFlag.LOCKED):
-                return False
+        # Must be a container or surface, and not a locked, closed container
+        flags = container._flags
+        if not flags & _HOLDS or (flags & _SHUT_MASK) == _LOCKED_SHUT:
+            return False
         
         # Check capacity
-        capacity = container.get_property('capacity', float('inf'))
-        current_count = len(self.get_contents(container.id))
-        if current_count >= capacity:
+        if len(self._contents.get(container_id, ())) >= container.capacity:
             return False
         
         # Check size constraints
-        max_size = container.get_property('max_item_size')
-        if max_size and obj.get_property('size', 1) > max_size:
-            return False
-        
-        # Can't contain itself
-        if container.id == obj.id:
+        max_size = container.max_item_size
+        if max_size and obj.size > max_size:
             return False
         
-        # Can't create circular containment
-        if self.is_in(container.id, obj.id):
-            return False
+        # Can't create circular containment: walk up from the container
+        get_location = self._locations.get
+        location = get_location(container_id)
+        while location:
+            if location == obj_id:
+                return False
+            location = get_location(location)
         
         return True
\ No newline at end of file
@@ -4,12 +4,15 @@
 Object flags system - translated from ZIL FLAGS
 """
 
-from enum import Flag, auto
+from enum import IntFlag, auto
 
-class ObjectFlag(Flag):
+class ObjectFlag(IntFlag):
     """
     Object flags - equivalent to ZIL FLAGS
     These determine object behaviors and properties
+    
+    An IntFlag, so members are plain ints and combine with the raw
+    GameObject._flags bits without building Flag instances
     """
     NONE = 0
     TAKEABLE = auto()      # Can be picked up (TAKEBIT)
@@ -39,4 +42,5 @@ class ObjectFlag(Flag):
     EVIDENCE = auto()      # Is evidence (custom for Deadline)
     HIDDEN = auto()        # Not visible until found
     FIXED = auto()         # Cannot be moved
-    SEARCHED = auto()      # Has been searched
\ No newline at end of file
+    SEARCHED = auto()      # Has been searched
+    DOOR = auto()          # Connects two rooms (DOORBIT)
\ No newline at end of file
@@ -5,7 +5,13 @@ Translated from ZIL to Python 3.13
 Preserves all original game logic while using modern Python patterns
 """
 
+import hashlib
 import json
+import marshal
+import mmap
+import os
+import time
+from bisect import bisect_right
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
@@ -13,10 +19,112 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 import logging
 
+from ..time.events import EventType
+from .exceptions import SaveLoadException
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib parser is used without it
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional; large vocabularies are parsed whole without it
+    ijson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_perf = time.perf_counter
+
+# Both accept raw bytes; orjson.JSONDecodeError subclasses json's
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Below this size mapping the file costs more than reading it
+_MMAP_JSON_MIN = 4096
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON data file; orjson reads large files straight from a mapping"""
+    with open(path, 'rb') as f:
+        if orjson is None or os.fstat(f.fileno()).st_size <= _MMAP_JSON_MIN:
+            return _json_loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+# Final-score bonus tiers: finishing under each threshold earns the bonus at
+# the same index; the trailing bonus applies past the last threshold
+_SPEED_THRESHOLDS = (180, 360, 540)  # Minutes: 3, 6 and 9 hours
+_SPEED_BONUSES = (30, 20, 10, 0)
+_MOVE_THRESHOLDS = (100, 200)
+_MOVE_BONUSES = (10, 5, 0)
+
+# Below this size a whole-file parse beats streaming
+_STREAM_VOCABULARY_MIN = 64 * 1024
+
+
+def _load_vocabulary(path: Path) -> Dict[str, Any]:
+    """
+    Load vocabulary.json, streaming just the word list when it is large
+    GameParser only reads the 'words' key
+    """
+    if ijson is None or path.stat().st_size < _STREAM_VOCABULARY_MIN:
+        return _load_json(path)
+    with open(path, 'rb') as f:
+        return {'words': list(ijson.items(f, 'words.item', use_float=True))}
+
+
+# Parsed JSON is cached per user (never beside the installed package),
+# keyed on the data directory and each source file's mtime and size.
+# marshal only rebuilds plain values, so a tampered cache can't run code
+_DATA_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "deadline"
+_DATA_SOURCES = ("game_data.json", "vocabulary.json", "syntax_rules.json")
+_DATA_CACHE_VERSION = 2
+
+
+def _data_cache_file(data_path: Path) -> Path:
+    """One cache file per data directory"""
+    digest = hashlib.sha1(str(data_path.resolve()).encode()).hexdigest()[:16]
+    return _DATA_CACHE_DIR / f"gamedata-{digest}.marshal"
+
+
+def _data_cache_key(data_path: Path) -> tuple:
+    """(mtime_ns, size) per source file, None for missing ones"""
+    key = [_DATA_CACHE_VERSION, str(data_path.resolve())]
+    for name in _DATA_SOURCES:
+        try:
+            st = (data_path / name).stat()
+        except OSError:
+            key.append(None)
+        else:
+            key.append((st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+
+def _read_data_cache(data_path: Path, key: tuple) -> Optional[tuple]:
+    """Return the cached (game_data, vocabulary, syntax_rules) if still fresh"""
+    try:
+        cached_key, data = marshal.loads(_data_cache_file(data_path).read_bytes())
+    except Exception:
+        return None
+    return data if cached_key == key else None
+
+
+def _write_data_cache(data_path: Path, key: tuple, data: tuple):
+    """Write the cache atomically; an unwritable cache directory just goes uncached"""
+    cache_file = _data_cache_file(data_path)
+    tmp_file = cache_file.with_suffix('.tmp')
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(marshal.dumps((key, data)))
+        os.replace(tmp_file, cache_file)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not write game data cache: {e}")
+
 
 class GameState(Enum):
     """Game state enumeration - matches ZIL game states"""
@@ -28,9 +136,12 @@ class GameState(Enum):
     QUIT = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GameConfig:
-    """Configuration for game engine - data-driven approach"""
+    """
+    Configuration for game engine - data-driven approach
+    Immutable; derive changed copies with dataclasses.replace()
+    """
     title: str = "Deadline"
     author: str = "Marc Blank"
     version: str = "1.0.0"
@@ -39,6 +150,7 @@ class GameConfig:
     start_time: int = 480  # 8:00 AM in minutes since midnight
     time_limit: int = 720  # 12 hours game time
     debug_mode: bool = False
+    autosave_every_n_moves: int = 0  # 0 disables autosave
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'GameConfig':
@@ -61,6 +173,8 @@ class GameEngine:
         """
         self.data_path = data_path
         self.config = GameConfig()
+        # Game time at which the case closes; refreshed whenever config changes
+        self._deadline_time = self.config.start_time + self.config.time_limit
         
         # Core game state - equivalent to ZIL globals
         self.state = GameState.PLAYING
@@ -82,15 +196,29 @@ class GameEngine:
         self.vocabulary: Dict[str, Any] = {}
         self.syntax_rules: List[Dict] = []
         
-        # Performance tracking
-        self.performance_stats = {
-            'commands_processed': 0,
-            'total_processing_time': 0,
-            'average_response_time': 0
-        }
+        # Solution data, fixed once the world is built
+        self._correct_murderer: Optional[str] = None
+        self._required_evidence_frozen: frozenset = frozenset()
+        # (evidence_version, result) of the last victory/failure checks
+        self._solved_check = (-1, False)
+        self._failure_check = (-1, False)
+        
+        # Performance tracking; response times are only measured in debug mode
+        self._cmd_count = 0
+        self._total_time = 0.0
         
         logger.info(f"Game Engine initialized with data path: {data_path}")
     
+    @property
+    def performance_stats(self) -> Dict[str, Any]:
+        """Command statistics, with the average derived on read"""
+        count, total = self._cmd_count, self._total_time
+        return {
+            'commands_processed': count,
+            'total_processing_time': total,
+            'average_response_time': total / count if count else 0.0
+        }
+    
     def load_game_data(self) -> bool:
         """
         Load all game data from JSON files
@@ -105,9 +233,33 @@ class GameEngine:
             if not game_data_file.exists():
                 logger.error(f"Game data file not found: {game_data_file}")
                 return False
+            
+            # Warm start: reuse the parsed data if no source file changed
+            cache_key = _data_cache_key(self.data_path)
+            cached = _read_data_cache(self.data_path, cache_key)
+            if cached is not None:
+                self.game_data, self.vocabulary, self.syntax_rules = cached
+            else:
+                self.game_data = _load_json(game_data_file)
                 
-            with open(game_data_file, 'r', encoding='utf-8') as f:
-                self.game_data = json.load(f)
+                # Load vocabulary
+                vocab_file = self.data_path / "vocabulary.json"
+                if vocab_file.exists():
+                    self.vocabulary = _load_vocabulary(vocab_file)
+                else:
+                    logger.warning(f"Vocabulary file not found: {vocab_file}")
+                    self.vocabulary = {"words": []}
+                
+                # Load syntax rules
+                syntax_file = self.data_path / "syntax_rules.json"
+                if syntax_file.exists():
+                    self.syntax_rules = _load_json(syntax_file)
+                else:
+                    logger.warning(f"Syntax rules file not found: {syntax_file}")
+                    self.syntax_rules = []
+                
+                _write_data_cache(self.data_path, cache_key,
+                                  (self.game_data, self.vocabulary, self.syntax_rules))
             
             # Load configuration from game data
             if 'config' in self.game_data:
@@ -115,24 +267,7 @@ class GameEngine:
             
             # Update start time from config
             self.current_time = self.config.start_time
-            
-            # Load vocabulary
-            vocab_file = self.data_path / "vocabulary.json"
-            if vocab_file.exists():
-                with open(vocab_file, 'r', encoding='utf-8') as f:
-                    self.vocabulary = json.load(f)
-            else:
-                logger.warning(f"Vocabulary file not found: {vocab_file}")
-                self.vocabulary = {"words": []}
-            
-            # Load syntax rules
-            syntax_file = self.data_path / "syntax_rules.json"
-            if syntax_file.exists():
-                with open(syntax_file, 'r', encoding='utf-8') as f:
-                    self.syntax_rules = json.load(f)
-            else:
-                logger.warning(f"Syntax rules file not found: {syntax_file}")
-                self.syntax_rules = []
+            self._deadline_time = self.config.start_time + self.config.time_limit
             
             logger.info(f"Game data loaded successfully: {self.config.title} v{self.config.version}")
             return True
@@ -153,12 +288,13 @@ class GameEngine:
         from ..parser.parser import GameParser
         from ..time.time_manager import TimeManager
         from ..commands.base_command import CommandProcessor
-        from ..io.interface import GameInterface
-        from ..io.save_system import SaveManager
         
         # Initialize world from data
         self.world_manager = WorldManager(self.game_data)
         self.world_manager.initialize_world()
+        solution = self.game_data.get('solution', {})
+        self._correct_murderer = solution.get('murderer')
+        self._required_evidence_frozen = frozenset(solution.get('required_evidence', []))
         
         # Initialize parser with vocabulary
         self.parser = GameParser(self.vocabulary, self.syntax_rules)
@@ -172,56 +308,85 @@ class GameEngine:
         # Initialize command processor
         self.command_processor = CommandProcessor(self)
         
-        # Initialize user interface
-        self.interface = GameInterface(self)
-        
-        # Initialize save system
-        self.save_manager = SaveManager(self)
+        # The user interface and save system are created on first use
         
         logger.info("All subsystems initialized")
     
+    def get_interface(self):
+        """The user interface, created on first use"""
+        if self.interface is None:
+            from ..io.interface import GameInterface
+            self.interface = GameInterface(self)
+        return self.interface
+    
+    def get_save_manager(self):
+        """The save system, created on first use"""
+        if self.save_manager is None:
+            from ..io.save_system import SaveManager
+            self.save_manager = SaveManager(self)
+        return self.save_manager
+    
     def start_game(self):
         """
         Start the game - main game loop
         Equivalent to ZIL's main routine
         """
+        interface = self.get_interface()
+        
         # Display intro
-        self.interface.display_intro()
+        interface.display_intro()
         
         # Display initial room
         current_room = self.world_manager.get_current_room()
         if current_room:
-            self.interface.display_room(current_room)
+            interface.display_room(current_room)
+        
+        # Bound once; the loop runs every turn
+        get_input = interface.get_input
+        display_result = interface.display_result
+        display_error = interface.display_error
+        process_command = self.process_command
+        update_game_state = self.update_game_state
+        check_game_conditions = self.check_game_conditions
+        PLAYING = GameState.PLAYING
         
         # Main game loop
-        while self.state == GameState.PLAYING:
+        while self.state is PLAYING:
             try:
                 # Get player input
-                command = self.interface.get_input()
+                command = get_input()
                 
                 if not command:
                     continue
                 
                 # Process command
-                result = self.process_command(command)
+                result = process_command(command)
                 
                 # Display result
                 if result:
-                    self.interface.display_result(result)
+                    display_result(result)
                 
                 # Update game state only if command consumed time
                 if result and result.get('consumed_time', True):
-                    self.update_game_state()
+                    update_game_state()
                 
                 # Check win/lose conditions
-                self.check_game_conditions()
+                check_game_conditions()
                 
             except KeyboardInterrupt:
                 self.quit_game()
                 break
             except Exception as e:
                 logger.error(f"Game error: {e}", exc_info=True)
-                self.interface.display_error(str(e))
+                display_error(str(e))
+        
+        # Let a save still being written in the background finish, and say
+        # so if it didn't make it to disk
+        if self.save_manager:
+            try:
+                self.save_manager.flush()
+            except SaveLoadException as e:
+                display_error(str(e))
         
         # Game ended - display appropriate ending
         self.display_ending()
@@ -237,8 +402,9 @@ class GameEngine:
         Returns:
             Result dictionary with status and message
         """
-        import time
-        start_time = time.perf_counter()
+        debug = self.config.debug_mode
+        if debug:
+            start_time = _perf()
         
         try:
             # Parse the command
@@ -255,18 +421,14 @@ class GameEngine:
             command_result = self.command_processor.execute(parse_result)
             
             # Update statistics
-            end_time = time.perf_counter()
-            processing_time = end_time - start_time
-            self.performance_stats['commands_processed'] += 1
-            self.performance_stats['total_processing_time'] += processing_time
-            self.performance_stats['average_response_time'] = (
-                self.performance_stats['total_processing_time'] / 
-                self.performance_stats['commands_processed']
-            )
+            self._cmd_count += 1
             
-            # Log performance if in debug mode
-            if self.config.debug_mode:
-                logger.debug(f"Command '{command_text}' processed in {processing_time:.3f}s")
+            # Time and log performance if in debug mode
+            if debug:
+                processing_time = _perf() - start_time
+                self._total_time += processing_time
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Command '%s' processed in %.3fs", command_text, processing_time)
             
             return command_result
             
@@ -286,14 +448,21 @@ class GameEngine:
         # Increment move counter
         self.moves += 1
         
-        # Advance game time
+        # Periodic autosave (a delta against the previous one)
+        every = self.config.autosave_every_n_moves
+        if every and self.moves % every == 0:
+            try:
+                self.get_save_manager().autosave()
+            except Exception as e:
+                logger.error(f"Autosave failed: {e}")
+        
+        # Advance game time; the engine clock never wraps at midnight
         self.current_time += 1
-        self.time_manager.advance_time(1)
         
-        # Process scheduled events
-        events = self.time_manager.get_current_events()
-        for event in events:
-            self.process_event(event)
+        # Process the scheduled events that came due
+        process_event = self.process_event
+        for event in self.time_manager.tick(1):
+            process_event(event)
         
         # Update NPCs
         self.world_manager.update_characters(self.current_time)
@@ -309,7 +478,7 @@ class GameEngine:
         Equivalent to ZIL's victory and failure checking
         """
         # Check time limit
-        if self.current_time >= self.config.start_time + self.config.time_limit:
+        if self.current_time >= self._deadline_time:
             self.state = GameState.LOST
             self.winner = "time"
             return
@@ -333,22 +502,26 @@ class GameEngine:
         # Check if player has accused the correct person with sufficient evidence
         evidence_manager = self.world_manager.evidence_manager
         
+        # Nothing to re-check unless evidence or the accusation changed
+        version = evidence_manager.evidence_version
+        checked_version, solved = self._solved_check
+        if version == checked_version:
+            return solved
+        
+        solved = False
         if evidence_manager.accusation_made:
-            correct_murderer = self.game_data.get('solution', {}).get('murderer')
             player_accusation = evidence_manager.accused_person
             
-            if player_accusation == correct_murderer:
-                # Check if player has sufficient evidence
-                required_evidence = set(self.game_data.get('solution', {}).get('required_evidence', []))
-                collected_evidence = set(evidence_manager.collected_evidence)
-                
-                if required_evidence.issubset(collected_evidence):
-                    return True
+            if player_accusation == self._correct_murderer:
+                # Check if player has sufficient evidence (collected_evidence is a set)
+                if self._required_evidence_frozen <= evidence_manager.collected_evidence:
+                    solved = True
                 else:
                     # Right person, insufficient evidence
                     self.winner = "insufficient_evidence"
         
-        return False
+        self._solved_check = (version, solved)
+        return solved
     
     def check_failure_conditions(self) -> bool:
         """
@@ -357,13 +530,19 @@ class GameEngine:
         # Check if player made wrong accusation
         evidence_manager = self.world_manager.evidence_manager
         
+        version = evidence_manager.evidence_version
+        checked_version, failed = self._failure_check
+        if version == checked_version:
+            return failed
+        
+        failed = False
         if evidence_manager.accusation_made:
-            correct_murderer = self.game_data.get('solution', {}).get('murderer')
-            if evidence_manager.accused_person != correct_murderer:
+            if evidence_manager.accused_person != self._correct_murderer:
                 self.winner = "wrong_accusation"
-                return True
+                failed = True
         
-        return False
+        self._failure_check = (version, failed)
+        return failed
     
     def calculate_final_score(self):
         """
@@ -374,12 +553,7 @@ class GameEngine:
         
         # Bonus for speed
         time_taken = self.current_time - self.config.start_time
-        if time_taken < 180:  # Less than 3 hours
-            base_score += 30
-        elif time_taken < 360:  # Less than 6 hours
-            base_score += 20
-        elif time_taken < 540:  # Less than 9 hours
-            base_score += 10
+        base_score += _SPEED_BONUSES[bisect_right(_SPEED_THRESHOLDS, time_taken)]
         
         # Bonus for evidence collected
         evidence_manager = self.world_manager.evidence_manager
@@ -387,63 +561,66 @@ class GameEngine:
         base_score += min(evidence_count * 2, 20)
         
         # Bonus for minimal moves
-        if self.moves < 100:
-            base_score += 10
-        elif self.moves < 200:
-            base_score += 5
+        base_score += _MOVE_BONUSES[bisect_right(_MOVE_THRESHOLDS, self.moves)]
         
-        self.score = min(base_score, self.config.max_score)
+        max_score = self.config.max_score
+        self.score = base_score if base_score < max_score else max_score
     
     def process_event(self, event):
         """
         Process a scheduled event
         Equivalent to ZIL's daemon/fuse processing
         """
-        from ..time.events import EventType
-        
-        event_type = event.event_type
-        
-        if event_type == EventType.CHARACTER_MOVEMENT:
-            character_id = event.get_character_id()
-            destination = event.get_location()
-            if character_id and destination:
-                self.world_manager.move_character(character_id, destination)
-            
-        elif event_type == EventType.CHARACTER_ACTION:
-            character_id = event.get_character_id()
-            action = event.get_action()
-            if character_id and action:
-                self.world_manager.character_action(character_id, action)
-            
-        elif event_type == EventType.PHONE_CALL:
-            message = event.get_message()
-            if message and self.world_manager.get_current_room().id == event.get_location():
-                self.interface.display_result({'status': 'info', 'message': message})
-            
-        elif event_type == EventType.GAME_OVER:
-            self.state = GameState.LOST
-            self.winner = "time"
+        handler = _EVENT_HANDLERS.get(event.event_type.value)
+        if handler is not None:
+            handler(self, event)
+    
+    def _on_character_movement(self, event):
+        """A character walks to a new location"""
+        character_id = event.get_character_id()
+        destination = event.get_location()
+        if character_id and destination:
+            self.world_manager.move_character(character_id, destination)
+    
+    def _on_character_action(self, event):
+        """A character performs a scripted action"""
+        character_id = event.get_character_id()
+        action = event.get_action()
+        if character_id and action:
+            self.world_manager.character_action(character_id, action)
+    
+    def _on_phone_call(self, event):
+        """The phone rings; only heard in the room it rings in"""
+        message = event.get_message()
+        if message and self.world_manager.current_room_id == event.get_location():
+            self.get_interface().display_result({'status': 'info', 'message': message})
+    
+    def _on_game_over(self, event):
+        """The scheduled end of the case"""
+        self.state = GameState.LOST
+        self.winner = "time"
     
     def display_ending(self):
         """
         Display appropriate game ending
         """
-        if self.state == GameState.WON:
-            self.interface.display_victory(self.score)
-        elif self.state == GameState.LOST:
+        interface = self.get_interface()
+        if self.state is GameState.WON:
+            interface.display_victory(self.score)
+        elif self.state is GameState.LOST:
             if self.winner == "time":
-                self.interface.display_timeout()
+                interface.display_timeout()
             elif self.winner == "wrong_accusation":
-                self.interface.display_failure()
+                interface.display_failure()
             elif self.winner == "insufficient_evidence":
-                self.interface.display_result({
+                interface.display_result({
                     'status': 'failure',
                     'message': "You identified the right person but lack sufficient evidence for a conviction."
                 })
             else:
-                self.interface.display_failure()
-        elif self.state == GameState.QUIT:
-            self.interface.display_quit()
+                interface.display_failure()
+        elif self.state is GameState.QUIT:
+            interface.display_quit()
     
     def save_game(self, filename: str = None) -> bool:
         """
@@ -451,7 +628,7 @@ class GameEngine:
         Equivalent to ZIL's SAVE routine
         """
         try:
-            return self.save_manager.save(filename)
+            return self.get_save_manager().save(filename)
         except Exception as e:
             logger.error(f"Save failed: {e}")
             return False
@@ -462,7 +639,7 @@ class GameEngine:
         Equivalent to ZIL's RESTORE routine
         """
         try:
-            return self.save_manager.load(filename)
+            return self.get_save_manager().load(filename)
         except Exception as e:
             logger.error(f"Load failed: {e}")
             return False
@@ -478,13 +655,22 @@ class GameEngine:
         """
         Get debug information about current game state
         """
-        current_room = self.world_manager.get_current_room() if self.world_manager else None
         return {
             'state': self.state.name,
             'score': self.score,
             'moves': self.moves,
             'time': f"{self.time_manager.get_time_string() if self.time_manager else 'N/A'}",
-            'current_room': current_room.id if current_room else None,
+            'current_room': self.world_manager.current_room_id if self.world_manager else None,
             'evidence_collected': len(self.world_manager.evidence_manager.collected_evidence) if self.world_manager else 0,
             'performance': self.performance_stats
-        }
\ No newline at end of file
+        }
+
+
+# Scheduled event handlers by raw EventType value, built once at import since
+# the set of event types is closed; types without a handler are ignored
+_EVENT_HANDLERS = {
+    EventType.CHARACTER_MOVEMENT.value: GameEngine._on_character_movement,
+    EventType.CHARACTER_ACTION.value: GameEngine._on_character_action,
+    EventType.PHONE_CALL.value: GameEngine._on_phone_call,
+    EventType.GAME_OVER.value: GameEngine._on_game_over,
+}
@@ -4,10 +4,12 @@ Base game object classes - translated from ZIL object system
 Implements the core object hierarchy and property system
 """
 
-from typing import Dict, List, Any, Optional, Set, TYPE_CHECKING, Tuple
+from typing import Dict, List, Any, Optional, Set, TYPE_CHECKING, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Flag, auto
 import logging
+import sys
+import weakref
 
 from .flags import ObjectFlag
 
@@ -16,6 +18,33 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Flags that change how an object reads in its container's contents list
+_INVISIBLE = ObjectFlag.INVISIBLE.value
+# Properties mirrored onto typed attributes for the containment checks
+_TYPED_PROPS = frozenset(('capacity', 'max_item_size', 'size'))
+
+# Flags that mark what kind of object this is; they survive reset/load
+_KIND_BITS = ObjectFlag.DOOR.value
+_DESC_BITS = (ObjectFlag.INVISIBLE | ObjectFlag.PROPER |
+              ObjectFlag.NARTICLE | ObjectFlag.PLURAL).value
+
+_CONTAINER = ObjectFlag.CONTAINER.value
+_OPEN = ObjectFlag.OPEN.value
+_OPEN_OR_TRANSPARENT = (ObjectFlag.OPEN | ObjectFlag.TRANSPARENT).value
+_HOLDS = (ObjectFlag.CONTAINER | ObjectFlag.SURFACE).value
+_TAKEABLE = ObjectFlag.TAKEABLE.value
+_TAKE_MASK = (ObjectFlag.TAKEABLE | ObjectFlag.SACRED).value
+_NO_ARTICLE = (ObjectFlag.PROPER | ObjectFlag.NARTICLE).value
+_PLURAL = ObjectFlag.PLURAL.value
+_LIGHT_ON_MASK = (ObjectFlag.LIGHT | ObjectFlag.ON).value
+
+# Bumped by every move_to; ancestor chains cached under an older value are stale
+_move_generation = 0
+
+# Every live object by id (ids are unique within a world); weak so discarded
+# worlds don't linger
+_OBJECT_REGISTRY: 'weakref.WeakValueDictionary[str, GameObject]' = weakref.WeakValueDictionary()
+
 
 @dataclass
 class GameObject:
@@ -38,6 +67,11 @@ class GameObject:
     # Properties dictionary - ZIL's property system
     properties: Dict[str, Any] = field(default_factory=dict)
     
+    # Containment limits, read directly by can_contain
+    capacity: float = float('inf')             # Max number of contents
+    max_item_size: Optional[int] = None        # Largest item that fits
+    size: int = 1                              # This object's size
+    
     # Vocabulary - for parser matching
     synonyms: List[str] = field(default_factory=list)    # Alternative names
     adjectives: List[str] = field(default_factory=list)  # Descriptive words
@@ -49,39 +83,102 @@ class GameObject:
     _original_location: Optional['GameObject'] = None
     _state_variables: Dict[str, Any] = field(default_factory=dict)
     
+    # Lowercased id/name/synonym -> object, for contents lookups
+    _name_index: Dict[str, 'GameObject'] = field(default_factory=dict, repr=False, compare=False)
+    # Exact id -> direct content, and wear_type -> worn direct content
+    _contents_by_id: Dict[str, 'GameObject'] = field(default_factory=dict, repr=False, compare=False)
+    _worn_by_type: Dict[str, 'GameObject'] = field(default_factory=dict, repr=False, compare=False)
+    # Joined inventory descriptions of visible contents; None when stale
+    _contents_desc: Optional[str] = field(default=None, repr=False, compare=False)
+    # This object's own inventory description; None when stale
+    _inv_desc: Optional[str] = field(default=None, repr=False, compare=False)
+    # (move generation, ancestors nearest first, their id()s); None until needed
+    _ancestors: Optional[Tuple[int, Tuple['GameObject', ...], frozenset]] = field(
+        default=None, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize object after creation"""
+        # Ids key most lookups; interning makes those compare by identity
+        self.id = sys.intern(self.id)
+        _OBJECT_REGISTRY[self.id] = self
+        
         # Store original location for reset
         self._original_location = self.location
         
+        # Words this object answers to, lowercased once
+        self._lookup_keys: Tuple[str, ...] = tuple(dict.fromkeys(
+            [self.id.lower(), self.name.lower()] + [s.lower() for s in self.synonyms]
+        ))
+        for obj in self.contents:
+            self._index_content(obj)
+        
+        # Property-supplied limits override the attribute defaults
+        props = self.properties
+        for prop_name in _TYPED_PROPS.intersection(props):
+            setattr(self, prop_name, props[prop_name])
+        
         # Add self to location's contents if location exists
         if self.location:
             self.move_to(self.location)
     
-    def has_flag(self, flag: ObjectFlag) -> bool:
+    def has_flag(self, flag: Union[ObjectFlag, int]) -> bool:
         """
-        Check if object has a specific flag
+        Check if object has a specific flag (ObjectFlag or raw bit)
         Equivalent to ZIL's FSET?
         """
-        return bool(self.flags & flag)
+        return bool(self._flags & (flag if type(flag) is int else flag._value_))
     
-    def set_flag(self, flag: ObjectFlag):
+    def set_flag(self, flag: Union[ObjectFlag, int]):
         """
         Set a flag on the object
         Equivalent to ZIL's FSET
         """
-        self.flags |= flag
+        bit = flag if type(flag) is int else flag._value_
+        self._flags |= bit
+        if bit & _DESC_BITS:
+            self._desc_changed()
     
-    def clear_flag(self, flag: ObjectFlag):
+    def clear_flag(self, flag: Union[ObjectFlag, int]):
         """
         Clear a flag from the object
         Equivalent to ZIL's FCLEAR
         """
-        self.flags &= ~flag
-    
-    def toggle_flag(self, flag: ObjectFlag):
+        bit = flag if type(flag) is int else flag._value_
+        self._flags &= ~bit
+        if bit & _DESC_BITS:
+            self._desc_changed()
+    
+    def test_and_clear(self, flag: Union[ObjectFlag, int]) -> bool:
+        """Clear a flag, returning whether it was set"""
+        bit = flag if type(flag) is int else flag._value_
+        flags = self._flags
+        self._flags = flags & ~bit
+        if bit & _DESC_BITS:
+            self._desc_changed()
+        return bool(flags & bit)
+    
+    def toggle_flag(self, flag: Union[ObjectFlag, int]):
         """Toggle a flag"""
-        self.flags ^= flag
+        bit = flag if type(flag) is int else flag._value_
+        self._flags ^= bit
+        if bit & _DESC_BITS:
+            self._desc_changed()
+    
+    def _desc_changed(self):
+        """Drop cached descriptions of this object and its container's contents"""
+        self._inv_desc = None
+        if self.location is not None:
+            self.location._contents_desc = None
+    
+    # Flags live in the plain int _flags; `flags` is a property installed
+    # after the class body so the dataclass keeps its ObjectFlag default
+    def _get_flags(self) -> ObjectFlag:
+        return ObjectFlag(self._flags)
+    
+    def _set_flags(self, value: ObjectFlag):
+        self._flags = value._value_ if isinstance(value, ObjectFlag) else int(value)
+        # Runs during __init__ too, where location is still the class default
+        self._desc_changed()
     
     def get_property(self, prop_name: str, default: Any = None) -> Any:
         """
@@ -96,6 +193,10 @@ class GameObject:
         Equivalent to ZIL's PUTP
         """
         self.properties[prop_name] = value
+        if prop_name == 'worn' and self.location is not None:
+            self.location._update_worn(self)
+        elif prop_name in _TYPED_PROPS:
+            setattr(self, prop_name, value)
     
     def has_property(self, prop_name: str) -> bool:
         """Check if object has a property"""
@@ -106,52 +207,144 @@ class GameObject:
         Move object to a new location
         Equivalent to ZIL's MOVE
         """
+        old_location = self.location
+        
+        # Already listed there: nothing moves (construction still gets here
+        # with location set but not yet listed, and falls through)
+        if (old_location is new_location and old_location is not None
+                and old_location._contents_by_id.get(self.id) is self):
+            return
+        
+        global _move_generation
+        _move_generation += 1
+        
         # Remove from current location
-        if self.location and self in self.location.contents:
-            self.location.contents.remove(self)
+        if old_location is not None:
+            old_location._remove_content(self)
         
         # Set new location
         self.location = new_location
         
         # Add to new location's contents
-        if new_location and self not in new_location.contents:
+        if new_location is not None and new_location._contents_by_id.get(self.id) is not self:
             new_location.contents.append(self)
+            new_location._index_content(self)
+    
+    def _remove_content(self, obj: 'GameObject'):
+        """Drop a direct content from the contents list and indexes"""
+        # Match by identity: list.remove/in would run the dataclass __eq__,
+        # which compares every field, against each sibling
+        contents = self.contents
+        for i, item in enumerate(contents):
+            if item is obj:
+                del contents[i]
+                self._unindex_content(obj)
+                return
+    
+    def _index_content(self, obj: 'GameObject'):
+        """Add a contained object to the name index"""
+        index = self._name_index
+        for key in obj._lookup_keys:
+            index.setdefault(key, obj)
+        self._contents_by_id[obj.id] = obj
+        self._contents_desc = None
+        if obj.properties.get('worn'):
+            self._update_worn(obj)
+    
+    def _unindex_content(self, obj: 'GameObject'):
+        """Remove a contained object from the name index"""
+        self._contents_desc = None
+        if self._contents_by_id.get(obj.id) is obj:
+            del self._contents_by_id[obj.id]
+        wear_type = obj.properties.get('wear_type', 'clothing')
+        if self._worn_by_type.get(wear_type) is obj:
+            del self._worn_by_type[wear_type]
+        index = self._name_index
+        for key in obj._lookup_keys:
+            if index.get(key) is obj:
+                del index[key]
+                # Another content may share the word; first one wins
+                for other in self.contents:
+                    if key in other._lookup_keys:
+                        index[key] = other
+                        break
+    
+    def _update_worn(self, obj: 'GameObject'):
+        """Sync the worn index with a contained object's 'worn' property"""
+        wear_type = obj.properties.get('wear_type', 'clothing')
+        if obj.properties.get('worn'):
+            self._worn_by_type[wear_type] = obj
+        elif self._worn_by_type.get(wear_type) is obj:
+            del self._worn_by_type[wear_type]
+    
+    def _visible_desc(self) -> str:
+        """
+        Comma-joined inventory descriptions of visible contents
+        Cached until contents move or change visibility/article flags;
+        only meaningful while this object is open
+        """
+        desc = self._contents_desc
+        if desc is None:
+            desc = self._contents_desc = ", ".join([
+                item.get_inventory_description() for item in self.contents
+                if not item._flags & _INVISIBLE
+            ])
+        return desc
+    
+    def find_content(self, obj_ref: str) -> Optional['GameObject']:
+        """Find a direct content by ID, name or synonym"""
+        return self._name_index.get(obj_ref.lower())
     
     def is_in(self, container: 'GameObject') -> bool:
         """
         Check if object is in a specific container (recursively)
         Equivalent to ZIL's IN?
         """
-        current = self.location
-        while current:
-            if current == container:
-                return True
+        return id(container) in self._get_ancestors()[2]
+    
+    def _get_ancestors(self) -> Tuple[int, Tuple['GameObject', ...], frozenset]:
+        """The location chain, rebuilt only after something has moved"""
+        cached = self._ancestors
+        location = self.location
+        # The parent check also catches a location assigned without move_to
+        if (cached is not None and cached[0] == _move_generation
+                and (cached[1][0] if cached[1] else None) is location):
+            return cached
+        chain = []
+        seen = set()
+        current = location
+        while current is not None:
+            if id(current) in seen:
+                logger.warning(f"Containment cycle above {self.id} at {current.id}")
+                break
+            seen.add(id(current))
+            chain.append(current)
             current = current.location
-        return False
+        cached = self._ancestors = (_move_generation, tuple(chain), frozenset(seen))
+        return cached
     
     def is_accessible(self) -> bool:
         """
         Check if object is accessible to player
         Considers containers being open, etc.
         """
-        # Check if any parent container is closed
-        current = self.location
-        while current:
-            if current.has_flag(ObjectFlag.CONTAINER):
-                if not current.has_flag(ObjectFlag.OPEN):
-                    return False
-            current = current.location
+        # Check if any parent container is closed; flags are read live since
+        # opening a container does not move anything
+        for current in self._get_ancestors()[1]:
+            if current._flags & (_CONTAINER | _OPEN) == _CONTAINER:
+                return False
         return True
     
     def is_visible(self) -> bool:
         """Check if object is visible to player"""
-        if self.has_flag(ObjectFlag.INVISIBLE):
+        if self._flags & _INVISIBLE:
             return False
         
         # Check if in a transparent or open container
-        if self.location and self.location.has_flag(ObjectFlag.CONTAINER):
-            if not (self.location.has_flag(ObjectFlag.OPEN) or 
-                   self.location.has_flag(ObjectFlag.TRANSPARENT)):
+        location = self.location
+        if location is not None:
+            flags = location._flags
+            if flags & _CONTAINER and not flags & _OPEN_OR_TRANSPARENT:
                 return False
         
         return True
@@ -161,22 +354,28 @@ class GameObject:
         Get all contents, optionally recursive
         Equivalent to ZIL's FIRST?/NEXT? iteration
         """
-        result = list(self.contents)
-        
-        if recursive:
-            for obj in self.contents:
-                result.extend(obj.get_all_contents(recursive=True))
-        
+        if not recursive:
+            return list(self.contents)
+        
+        # Explicit stack instead of one call frame per level; each object's
+        # contents are listed together, ahead of any of their own contents
+        result = []
+        extend = result.extend
+        stack = [self]
+        pop = stack.pop
+        while stack:
+            contents = pop().contents
+            if contents:
+                extend(contents)
+                stack.extend(reversed(contents))
         return result
     
     def find_object(self, obj_id: str) -> Optional['GameObject']:
         """Find an object by ID in contents (recursive)"""
-        for obj in self.contents:
-            if obj.id == obj_id:
-                return obj
-            found = obj.find_object(obj_id)
-            if found:
-                return found
+        # Look the id up directly, then confirm it sits somewhere below us
+        obj = _OBJECT_REGISTRY.get(obj_id)
+        if obj is not None and obj.is_in(self):
+            return obj
         return None
     
     def matches_vocabulary(self, words: List[str]) -> bool:
@@ -217,9 +416,10 @@ class GameObject:
     
     def get_article(self) -> str:
         """Get appropriate article for object"""
-        if self.has_flag(ObjectFlag.PROPER) or self.has_flag(ObjectFlag.NARTICLE):
+        flags = self._flags
+        if flags & _NO_ARTICLE:
             return ""
-        if self.has_flag(ObjectFlag.PLURAL):
+        if flags & _PLURAL:
             return "some"
         
         # Check for vowel start
@@ -229,31 +429,31 @@ class GameObject:
     
     def get_inventory_description(self) -> str:
         """Get description for inventory listing"""
-        article = self.get_article()
-        if article:
-            return f"{article} {self.name}"
-        return self.name
+        desc = self._inv_desc
+        if desc is None:
+            article = self.get_article()
+            desc = self._inv_desc = f"{article} {self.name}" if article else self.name
+        return desc
     
     def can_take(self) -> bool:
         """Check if object can be taken"""
-        return self.has_flag(ObjectFlag.TAKEABLE) and not self.has_flag(ObjectFlag.SACRED)
+        return self._flags & _TAKE_MASK == _TAKEABLE
     
     def can_contain(self, obj: 'GameObject') -> bool:
         """
         Check if this object can contain another object
         Considers capacity, size, etc.
         """
-        if not self.has_flag(ObjectFlag.CONTAINER) and not self.has_flag(ObjectFlag.SURFACE):
+        if not self._flags & _HOLDS:
             return False
         
         # Check capacity if defined
-        capacity = self.get_property('capacity', float('inf'))
-        if len(self.contents) >= capacity:
+        if len(self.contents) >= self.capacity:
             return False
         
         # Check size constraints if defined
-        max_size = self.get_property('max_item_size')
-        if max_size and obj.get_property('size', 0) > max_size:
+        max_size = self.max_item_size
+        if max_size and obj.size > max_size:
             return False
         
         return True
@@ -261,7 +461,7 @@ class GameObject:
     def reset(self):
         """Reset object to initial state"""
         self.move_to(self._original_location)
-        self.flags = ObjectFlag.NONE  # Reset to initial flags
+        self._set_flags(self._flags & _KIND_BITS)  # Reset to initial flags
         self._state_variables.clear()
     
     def save_state(self) -> Dict[str, Any]:
@@ -269,16 +469,21 @@ class GameObject:
         return {
             'id': self.id,
             'location': self.location.id if self.location else None,
-            'flags': self.flags.value,
+            'flags': self._flags,
             'properties': dict(self.properties),
             'state_variables': dict(self._state_variables)
         }
     
     def load_state(self, state: Dict[str, Any]):
         """Load object state from save data"""
-        self.flags = ObjectFlag(state.get('flags', 0))
-        self.properties.update(state.get('properties', {}))
+        self.flags = ObjectFlag(state.get('flags', 0) | (self._flags & _KIND_BITS))
+        props = state.get('properties', {})
+        self.properties.update(props)
+        for prop_name in _TYPED_PROPS.intersection(props):
+            setattr(self, prop_name, props[prop_name])
         self._state_variables.update(state.get('state_variables', {}))
+        if self.location is not None:
+            self.location._update_worn(self)
         # Location will be restored by world manager
     
     def __str__(self) -> str:
@@ -288,6 +493,10 @@ class GameObject:
         return f"GameObject(id='{self.id}', name='{self.name}', location={self.location.id if self.location else None})"
 
 
+GameObject.flags = property(GameObject._get_flags, GameObject._set_flags,
+                            doc="Object flags (ObjectFlag view of the _flags bitmask)")
+
+
 class Room(GameObject):
     """
     Room class - represents locations in the game
@@ -325,10 +534,16 @@ class Room(GameObject):
         if not self.light_needed:
             return False
         
-        # Check for light sources in room
-        for obj in self.get_all_contents():
-            if obj.has_flag(ObjectFlag.LIGHT) and obj.has_flag(ObjectFlag.ON):
+        # Check for light sources in room, stopping at the first lit one;
+        # visiting order doesn't matter, so the stack is never reordered
+        stack = list(self.contents)
+        pop, extend = stack.pop, stack.extend
+        while stack:
+            obj = pop()
+            if obj._flags & _LIGHT_ON_MASK == _LIGHT_ON_MASK:
                 return False
+            if obj.contents:
+                extend(obj.contents)
         
         return True
     
@@ -378,8 +593,7 @@ class Item(GameObject):
         kwargs.setdefault('flags', ObjectFlag.TAKEABLE)
         super().__init__(**kwargs)
         
-        # Item-specific properties
-        self.size: int = kwargs.get('size', 1)
+        # Item-specific properties (size is a GameObject field)
         self.weight: int = kwargs.get('weight', 1)
         self.value: int = kwargs.get('value', 0)
 
@@ -395,8 +609,7 @@ class Container(GameObject):
         kwargs['flags'] = flags | ObjectFlag.CONTAINER
         super().__init__(**kwargs)
         
-        # Container-specific properties
-        self.capacity: int = kwargs.get('capacity', 10)
+        # Container-specific properties (capacity is a GameObject field)
         self.key_id: Optional[str] = kwargs.get('key_id')  # ID of key that opens this
         
     def open(self) -> bool:
@@ -496,7 +709,7 @@ class Player(GameObject):
             return False
         
         # Check item count
-        carried_items = [o for o in self.contents if o.has_flag(ObjectFlag.TAKEABLE)]
+        carried_items = [o for o in self.contents if o._flags & _TAKEABLE]
         if len(carried_items) >= self.max_carry_items:
             return False
         
@@ -510,7 +723,7 @@ class Player(GameObject):
     
     def get_inventory(self) -> List[GameObject]:
         """Get list of carried items"""
-        return [obj for obj in self.contents if obj.has_flag(ObjectFlag.TAKEABLE)]
+        return [obj for obj in self.contents if obj._flags & _TAKEABLE]
     
     def is_wearing(self, obj: GameObject) -> bool:
         """Check if player is wearing an object"""
@@ -524,16 +737,14 @@ class Door(GameObject):
     """
     
     def __init__(self, **kwargs):
+        # Doors typically start closed
+        kwargs['flags'] = kwargs.get('flags', ObjectFlag.NONE) | ObjectFlag.DOOR
         super().__init__(**kwargs)
         
         # Door-specific properties
         self.connects: Tuple[str, str] = kwargs.get('connects', (None, None))
         self.key_id: Optional[str] = kwargs.get('key_id')
         self.both_sides: bool = kwargs.get('both_sides', True)  # Visible from both sides
-        
-        # Doors typically start closed
-        if 'flags' not in kwargs:
-            self.flags = ObjectFlag.NONE
     
     def is_passable(self) -> bool:
         """Check if door can be passed through"""
@@ -827,8 +1038,10 @@ def create_game_object_from_data(object_id: str, data: Dict[str, Any]) -> GameOb
             try:
                 # Handle both lowercase and uppercase
                 flag_name = flag_str.upper()
-                if hasattr(ObjectFlag, flag_name):
-                    flags |= getattr(ObjectFlag, flag_name)
+                # Look in the members only; IntFlag also carries int attributes
+                flag = ObjectFlag.__members__.get(flag_name)
+                if flag is not None:
+                    flags |= flag
                 else:
                     logger.warning(f"Unknown flag '{flag_str}' for object '{object_id}'")
             except Exception as e:
@@ -1085,6 +1298,8 @@ class Door(GameObject):
     def __init__(self, connects: tuple, key_id: Optional[str] = None,
                  both_sides: bool = True, locked_message: str = "It's locked.",
                  closed_message: str = "It's closed.", **kwargs):
+        flags = kwargs.get('flags', ObjectFlag.NONE)
+        kwargs['flags'] = flags | ObjectFlag.DOOR
         super().__init__(**kwargs)
         
         self.connects = connects  # Tuple of (room1_id, room2_id)
@@ -6,16 +6,150 @@ from typing import List
 from ..core.game_engine import GameState
 
 import json
+import mmap
+import os
 import pickle
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
+try:
+    import zstandard
+except ImportError:  # Optional; saves fall back to zlib
+    zstandard = None
+
 from ..core.exceptions import SaveLoadException
 
 logger = logging.getLogger(__name__)
 
+# Save file framing: magic, format version, codec id, compressed pickle.
+# Files without the magic are read as bare pickles from older versions.
+_MAGIC = b'DLSV'
+_FORMAT_VERSION = 1
+_CODEC_ZLIB = 0
+_CODEC_ZSTD = 1
+_HEADER_SIZE = len(_MAGIC) + 2
+
+# Autosave file: magic and version, then frames of
+# <scheme=codec><encoding><raw size><encoded size><compressed size><payload>.
+# A FULL frame holds every state entry, a DELTA frame only the changed ones;
+# loading replays the frames in order.
+_AUTOSAVE_MAGIC = b'DLAS'
+_AUTOSAVE_NAME = "autosave.dlas"
+_FRAME = struct.Struct('<BBIII')
+_ENC_FULL = 0
+_ENC_DELTA = 1
+# Start a fresh file after this many deltas so replay stays short
+_AUTOSAVE_REBASE = 50
+
+
+def _compress(raw: bytes) -> Tuple[int, bytes]:
+    """Compress with zstd when available, else zlib; returns (codec, payload)"""
+    if zstandard is not None:
+        return _CODEC_ZSTD, zstandard.ZstdCompressor(level=3).compress(raw)
+    return _CODEC_ZLIB, zlib.compress(raw, 3)
+
+
+def _decompress(codec: int, payload) -> bytes:
+    """Inverse of _compress"""
+    if codec == _CODEC_ZSTD:
+        if zstandard is None:
+            raise SaveLoadException("Save is zstd-compressed; install 'zstandard' to load it")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress(payload)
+    raise SaveLoadException(f"Unknown save codec {codec}")
+
+
+def _frame_save(raw: bytes) -> bytes:
+    """Compress an already-pickled save and add the file header"""
+    codec, payload = _compress(raw)
+    return _MAGIC + bytes((_FORMAT_VERSION, codec)) + payload
+
+
+def _flatten_save(save_data: Dict[str, Any]) -> Dict[Tuple[str, ...], bytes]:
+    """Split save data into independently pickled entries for delta encoding"""
+    flat = {}
+    for section, value in save_data.items():
+        if section == 'world_state':
+            for obj_id, obj_state in value['object_states'].items():
+                flat[('object', obj_id)] = obj_state
+            flat[('world', 'current_room_id')] = value['current_room_id']
+            flat[('world', 'character_states')] = value['character_states']
+        else:
+            flat[(section,)] = value
+    dumps, protocol = pickle.dumps, pickle.HIGHEST_PROTOCOL
+    return {key: dumps(value, protocol) for key, value in flat.items()}
+
+
+def _unflatten_save(flat: Dict[Tuple[str, ...], bytes]) -> Dict[str, Any]:
+    """Inverse of _flatten_save"""
+    save_data: Dict[str, Any] = {}
+    world = save_data['world_state'] = {'object_states': {}}
+    for key, blob in flat.items():
+        value = pickle.loads(blob)
+        if key[0] == 'object':
+            world['object_states'][key[1]] = value
+        elif key[0] == 'world':
+            world[key[1]] = value
+        else:
+            save_data[key[0]] = value
+    return save_data
+
+
+def _replay_autosave(buf) -> Dict[str, Any]:
+    """Rebuild save data from an autosave's base frame and deltas"""
+    version = buf[len(_AUTOSAVE_MAGIC)]
+    if version != _FORMAT_VERSION:
+        raise SaveLoadException(f"Unsupported autosave version {version}")
+    view = memoryview(buf)
+    offset, end = len(_AUTOSAVE_MAGIC) + 1, len(buf)
+    flat: Dict[Tuple[str, ...], bytes] = {}
+    while offset < end:
+        codec, encoding, _, _, size = _FRAME.unpack_from(view, offset)
+        offset += _FRAME.size
+        entries = pickle.loads(_decompress(codec, view[offset:offset + size]))
+        offset += size
+        if encoding == _ENC_FULL:
+            flat = entries
+        else:
+            flat.update(entries)
+    return _unflatten_save(flat)
+
+
+def _decode_save(buf) -> Dict[str, Any]:
+    """Inverse of _frame_save, unpickled; accepts any bytes-like buffer"""
+    magic = buf[:len(_MAGIC)]
+    if magic == _AUTOSAVE_MAGIC:
+        return _replay_autosave(buf)
+    if magic != _MAGIC:
+        return pickle.loads(buf)
+    version, codec = buf[len(_MAGIC)], buf[len(_MAGIC) + 1]
+    if version != _FORMAT_VERSION:
+        raise SaveLoadException(f"Unsupported save format version {version}")
+    return pickle.loads(_decompress(codec, memoryview(buf)[_HEADER_SIZE:]))
+
+
+def _read_save(save_path: Path) -> Dict[str, Any]:
+    """Decode a save file, letting the decompressor read its pages via mmap"""
+    with open(save_path, 'rb') as f:
+        # mmap refuses empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            raise SaveLoadException(f"Save file is empty: {save_path.name}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                return _decode_save(mm)
+            except SaveLoadException as e:
+                error = str(e)
+            except Exception as e:
+                error = f"Save file is corrupt: {save_path.name} ({e})"
+    # Raised once the map is closed; the traceback pins views into it
+    raise SaveLoadException(error)
+
 
 class SaveManager:
     """
@@ -28,6 +162,17 @@ class SaveManager:
         self.engine = engine
         self.save_dir = Path.home() / ".deadline_saves"
         self.save_dir.mkdir(exist_ok=True)
+        # (name, mtime) of every save file -> list_saves() result for them
+        self._saves_cache: Optional[Tuple[Tuple[Tuple[str, int], ...], List[Dict[str, Any]]]] = None
+        # Compression and disk writes run here; one worker keeps saves ordered
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="deadline-save")
+        self._pending: List[Future] = []
+        # First background save that failed and hasn't been reported yet
+        self._failed_save: Optional[BaseException] = None
+        # Entries on disk in the autosave file, and deltas since its base;
+        # only the writer thread touches these while writes are pending
+        self._autosave_state: Optional[Dict[Tuple[str, ...], bytes]] = None
+        self._autosave_deltas = 0
         
     def save(self, filename: str = None) -> bool:
         """
@@ -40,27 +185,20 @@ class SaveManager:
             True if save successful
         """
         try:
+            # An earlier save that failed in the background fails this one
+            self.flush()
+            
             if not filename:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"deadline_save_{timestamp}.sav"
             
             save_path = self.save_dir / filename
             
-            # Gather game state
-            save_data = {
-                'version': '1.0',
-                'timestamp': datetime.now().isoformat(),
-                'engine_state': self._get_engine_state(),
-                'world_state': self._get_world_state(),
-                'time_state': self._get_time_state(),
-                'evidence_state': self._get_evidence_state()
-            }
-            
-            # Save to file
-            with open(save_path, 'wb') as f:
-                pickle.dump(save_data, f)
-            
-            logger.info(f"Game saved to {save_path}")
+            # Snapshot and open the file now, so bad paths and permissions
+            # fail this SAVE; compress and write in the background
+            raw = pickle.dumps(self._gather_state(), protocol=pickle.HIGHEST_PROTOCOL)
+            f = open(save_path, 'wb')
+            self._submit(self._write_save, f, save_path, raw)
             return True
             
         except Exception as e:
@@ -77,6 +215,7 @@ class SaveManager:
         Returns:
             True if load successful
         """
+        self._wait()
         try:
             save_path = self.save_dir / filename
             
@@ -87,8 +226,7 @@ class SaveManager:
                     raise SaveLoadException(f"Save file not found: {filename}")
             
             # Load save data
-            with open(save_path, 'rb') as f:
-                save_data = pickle.load(f)
+            save_data = _read_save(save_path)
             
             # Validate version
             if save_data.get('version') != '1.0':
@@ -100,6 +238,9 @@ class SaveManager:
             self._restore_time_state(save_data['time_state'])
             self._restore_evidence_state(save_data['evidence_state'])
             
+            # The next autosave starts a fresh base from the loaded state
+            self._autosave_state = None
+            
             logger.info(f"Game loaded from {save_path}")
             return True
             
@@ -108,13 +249,18 @@ class SaveManager:
             raise SaveLoadException(f"Failed to load game: {e}")
     
     def list_saves(self) -> List[Dict[str, Any]]:
-        """List available save files"""
-        saves = []
+        """List available save files (re-read only when the files change)"""
+        self._wait()
+        save_files = sorted(self.save_dir.glob("*.sav"))
+        key = tuple((p.name, p.stat().st_mtime_ns) for p in save_files)
+        cached = self._saves_cache
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
         
-        for save_file in self.save_dir.glob("*.sav"):
+        saves = []
+        for save_file in save_files:
             try:
-                with open(save_file, 'rb') as f:
-                    save_data = pickle.load(f)
+                save_data = _read_save(save_file)
                 
                 saves.append({
                     'filename': save_file.name,
@@ -125,10 +271,13 @@ class SaveManager:
             except:
                 continue
         
-        return sorted(saves, key=lambda x: x['timestamp'], reverse=True)
+        saves.sort(key=lambda x: x['timestamp'], reverse=True)
+        self._saves_cache = (key, saves)
+        return list(saves)
     
     def delete_save(self, filename: str) -> bool:
         """Delete a save file"""
+        self._wait()
         try:
             save_path = self.save_dir / filename
             if save_path.exists():
@@ -139,6 +288,97 @@ class SaveManager:
             logger.error(f"Failed to delete save: {e}")
             return False
     
+    def autosave(self):
+        """
+        Append the current state to the autosave file
+        Writes a full frame the first time (and every _AUTOSAVE_REBASE
+        frames), otherwise only the entries changed since the last frame
+        """
+        flat = _flatten_save(self._gather_state())
+        self._submit(self._write_autosave, self.save_dir / _AUTOSAVE_NAME, flat)
+    
+    def _write_autosave(self, path: Path, flat: Dict[Tuple[str, ...], bytes]):
+        """
+        Worker-thread half of autosave(): encode and write one frame
+        The delta base only advances once a frame is on disk; after a
+        failure the next autosave starts a fresh file with a full frame
+        """
+        previous = self._autosave_state
+        full = previous is None or self._autosave_deltas >= _AUTOSAVE_REBASE
+        if full:
+            entries = flat
+        else:
+            entries = {key: blob for key, blob in flat.items() if previous.get(key) != blob}
+        try:
+            raw_size = sum(map(len, flat.values()))
+            encoded = pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL)
+            codec, payload = _compress(encoded)
+            header = _FRAME.pack(codec, _ENC_FULL if full else _ENC_DELTA,
+                                 raw_size, len(encoded), len(payload))
+            if full:
+                # Replace atomically so a failed rebase leaves the old file whole
+                tmp_path = path.with_suffix('.tmp')
+                with open(tmp_path, 'wb') as f:
+                    f.write(_AUTOSAVE_MAGIC + bytes((_FORMAT_VERSION,)) + header + payload)
+                os.replace(tmp_path, path)
+            else:
+                with open(path, 'ab') as f:
+                    f.write(header + payload)
+        except Exception as e:
+            logger.error(f"Autosave failed: {e}")
+            self._autosave_state = None
+            return
+        self._autosave_state = flat
+        self._autosave_deltas = 0 if full else self._autosave_deltas + 1
+    
+    def _submit(self, fn, *args):
+        """Queue a write on the writer thread"""
+        # Finished writes that succeeded need no further attention
+        self._pending = [f for f in self._pending if not f.done() or f.exception() is not None]
+        self._pending.append(self._writer.submit(fn, *args))
+    
+    def _wait(self):
+        """Wait for background writes; remember the first save that failed"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            error = future.exception()
+            if error is not None and self._failed_save is None:
+                self._failed_save = error
+    
+    def flush(self):
+        """
+        Wait for any background save to reach the disk
+        Raises SaveLoadException if one failed since the last flush
+        """
+        self._wait()
+        error, self._failed_save = self._failed_save, None
+        if error is not None:
+            raise SaveLoadException(f"Background save failed: {error}")
+    
+    @staticmethod
+    def _write_save(f, save_path: Path, raw: bytes):
+        """Worker-thread half of save(): compress and write the snapshot to the open file"""
+        try:
+            with f:
+                f.write(_frame_save(raw))
+        except Exception as e:
+            logger.error(f"Save failed: {e}")
+            # Don't leave a truncated save behind
+            save_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"Game saved to {save_path}")
+    
+    def _gather_state(self) -> Dict[str, Any]:
+        """Collect everything a save file records"""
+        return {
+            'version': '1.0',
+            'timestamp': datetime.now().isoformat(),
+            'engine_state': self._get_engine_state(),
+            'world_state': self._get_world_state(),
+            'time_state': self._get_time_state(),
+            'evidence_state': self._get_evidence_state()
+        }
+    
     def _get_engine_state(self) -> Dict[str, Any]:
         """Get engine state for saving"""
         return {
@@ -222,7 +462,7 @@ class SaveManager:
     def _restore_evidence_state(self, state: Dict[str, Any]):
         """Restore evidence state from save"""
         evidence = self.engine.world_manager.evidence_manager
-        evidence.collected_evidence = set(state['collected_evidence'])
+        evidence.restore_collected(state['collected_evidence'])
         evidence.accusation_made = state['accusation_made']
         evidence.accused_person = state['accused_person']
         evidence.case_solved = state['case_solved']
\ No newline at end of file
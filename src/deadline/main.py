@@ -7,6 +7,7 @@ import sys
 import argparse
 from pathlib import Path
 import logging
+from dataclasses import replace
 from typing import Optional
 
 from deadline.core.game_engine import GameEngine
@@ -60,7 +61,7 @@ def main():
         
         # Set debug mode
         if args.debug:
-            engine.config.debug_mode = True
+            engine.config = replace(engine.config, debug_mode=True)
         
         # Load game data
         if not engine.load_game_data():
@@ -13,6 +13,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Parses are context-free, so valid results are reused for repeated input
+_PARSE_CACHE_SIZE = 128
+
 
 class WordType(Enum):
     """Word types in vocabulary - matches ZIL word types"""
@@ -52,6 +55,15 @@ class ParseResult:
     error_message: Optional[str] = None
     ambiguous_objects: List[str] = field(default_factory=list)
     raw_input: str = ""
+    verb_lower: Optional[str] = field(default=None, init=False, repr=False)
+    direct_object_lc: Optional[str] = field(default=None, init=False, repr=False)
+    
+    def __post_init__(self):
+        """Lowercase the verb and direct object once so commands don't repeat it"""
+        if self.verb:
+            self.verb_lower = self.verb.lower()
+        if self.direct_object:
+            self.direct_object_lc = self.direct_object.lower()
     
     def __repr__(self):
         if self.is_valid:
@@ -131,6 +143,9 @@ class GameParser:
         
         # Context for disambiguation
         self.current_context = None
+        
+        # Stripped input -> valid ParseResult, oldest entries evicted first
+        self._parse_cache: Dict[str, ParseResult] = {}
     
     def _init_standard_words(self):
         """Initialize standard parser words"""
@@ -294,6 +309,13 @@ class GameParser:
                 raw_input=original_input
             )
         
+        # Repeated commands ("look", "n") skip tokenizing and matching
+        cached = self._parse_cache.get(original_input)
+        if cached is not None:
+            self.last_command = original_input
+            self.last_parse_result = cached
+            return cached
+        
         # Expand shortcuts
         first_word = input_lower.split()[0] if input_lower.split() else ""
         if first_word in self.shortcuts:
@@ -335,6 +357,10 @@ class GameParser:
         if result.is_valid:
             self.last_command = original_input
             self.last_parse_result = result
+            cache = self._parse_cache
+            if len(cache) >= _PARSE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[original_input] = result
         
         return result
     
@@ -670,6 +696,7 @@ class GameParser:
         if word_lower not in self.vocabulary_entries:
             self.vocabulary_entries[word_lower] = []
         self.vocabulary_entries[word_lower].append(entry)
+        self._parse_cache.clear()
     
     def add_syntax_pattern(self, pattern: str, verb: str, slots: List[str]):
         """Add a syntax pattern dynamically"""
@@ -678,6 +705,7 @@ class GameParser:
             verb=verb,
             slots=slots
         ))
+        self._parse_cache.clear()
     
     def get_vocabulary_matches(self, word: str) -> List[VocabularyEntry]:
         """Get all vocabulary entries matching a word"""
@@ -3,7 +3,7 @@
 Event scheduling system
 """
 
-from typing import List, Optional, Any, Dict
+from typing import Iterable, List, Optional, Any, Dict, Tuple
 from dataclasses import dataclass, field
 import heapq
 from enum import Enum
@@ -11,7 +11,7 @@ from enum import Enum
 from .events import EventType, GameEvent
 
 
-@dataclass(order=True)
+@dataclass
 class ScheduledEvent:
     """A scheduled event with priority"""
     time: int
@@ -28,10 +28,14 @@ class EventScheduler:
     """
     Manages scheduled events
     Uses a priority queue for efficient event processing
+    
+    Heap entries are (time, priority, event_id, event) tuples, so ordering
+    is decided by C-level tuple comparison; event_id breaks ties in
+    scheduling order and the event itself is never compared
     """
     
     def __init__(self):
-        self.events: List[ScheduledEvent] = []
+        self.events: List[Tuple[int, int, int, GameEvent]] = []
         self.event_id_counter = 0
         self.cancelled_events: set = set()
     
@@ -43,64 +47,49 @@ class EventScheduler:
         event_id = self.event_id_counter
         self.event_id_counter += 1
         
-        scheduled = ScheduledEvent(
-            time=event.time,
-            event=event,
-            priority=priority
-        )
-        
-        heapq.heappush(self.events, scheduled)
+        heapq.heappush(self.events, (event.time, priority, event_id, event))
         return event_id
     
+    def schedule_many(self, events: Iterable[GameEvent], priority: int = 0):
+        """Schedule a batch of events, restoring the heap once at the end"""
+        heap = self.events
+        event_id = self.event_id_counter
+        for event in events:
+            heap.append((event.time, priority, event_id, event))
+            event_id += 1
+        self.event_id_counter = event_id
+        heapq.heapify(heap)
+    
     def get_events_at_time(self, time: int) -> List[GameEvent]:
         """Get all events scheduled for a specific time"""
-        events = []
-        
-        # Look at events without removing them
-        for scheduled in self.events:
-            if scheduled.time == time:
-                events.append(scheduled.event)
-            elif scheduled.time > time:
-                break  # Events are sorted by time
-        
-        return events
+        # Look at events without removing them; heap order is only partial
+        return [entry[3] for entry in sorted(self.events) if entry[0] == time]
     
     def get_events_in_range(self, start_time: int, end_time: int) -> List[GameEvent]:
         """Get all events in a time range"""
+        heap = self.events
         events = []
         processed = []
         
-        while self.events:
-            scheduled = heapq.heappop(self.events)
-            
-            if scheduled.time > end_time:
-                # Put it back and stop
-                heapq.heappush(self.events, scheduled)
-                break
-            
-            if scheduled.time > start_time:
-                events.append(scheduled.event)
+        # Only the due prefix of the heap is ever popped
+        while heap and heap[0][0] <= end_time:
+            entry = heapq.heappop(heap)
+            if entry[0] > start_time:
+                events.append(entry[3])
             else:
                 # Keep for later
-                processed.append(scheduled)
+                processed.append(entry)
         
         # Put back unprocessed events
-        for scheduled in processed:
-            heapq.heappush(self.events, scheduled)
+        for entry in processed:
+            heapq.heappush(heap, entry)
         
         return events
     
     def cancel_events_of_type(self, event_type: EventType):
         """Cancel all events of a specific type"""
-        remaining = []
-        
-        while self.events:
-            scheduled = heapq.heappop(self.events)
-            if scheduled.event.event_type != event_type:
-                remaining.append(scheduled)
-        
-        # Rebuild heap
-        self.events = remaining
+        # Filter, then rebuild the heap in one pass
+        self.events = [entry for entry in self.events if entry[3].event_type != event_type]
         heapq.heapify(self.events)
     
     def clear_all_events(self):
@@ -111,7 +100,7 @@ class EventScheduler:
     def get_next_event_time(self) -> Optional[int]:
         """Get the time of the next scheduled event"""
         if self.events:
-            return self.events[0].time
+            return self.events[0][0]
         return None
     
     def has_events(self) -> bool:
@@ -45,14 +45,15 @@ class TimeManager:
             with open(schedule_file, 'r') as f:
                 schedules_data = json.load(f)
             
-            # Load one-time events
-            for event_data in schedules_data.get('events', []):
-                event = GameEvent(
+            # Load one-time events; the heap is built once for the batch
+            self.scheduler.schedule_many(
+                GameEvent(
                     time=event_data['time'],
                     event_type=EventType[event_data['type']],
                     data=event_data.get('data', {})
                 )
-                self.scheduler.schedule(event)
+                for event_data in schedules_data.get('events', [])
+            )
             
             # Load recurring events (daemons)
             for daemon_data in schedules_data.get('daemons', []):
@@ -69,8 +70,16 @@ class TimeManager:
         Advance game time by specified minutes
         Processes any events that occur
         """
+        for event in self.tick(minutes):
+            self._process_event(event)
+    
+    def tick(self, minutes: int = 1) -> List[GameEvent]:
+        """
+        Advance game time and return the events that came due
+        Runs daemons; the caller handles the events
+        """
         if self.time_stopped:
-            return
+            return []
         
         old_time = self.current_time
         self.current_time += minutes
@@ -80,10 +89,8 @@ class TimeManager:
             self.current_time %= 1440
             self.current_day = (self.current_day + 1) % 7
         
-        # Process events in the time range
+        # Collect events in the time range
         events = self.scheduler.get_events_in_range(old_time, self.current_time)
-        for event in events:
-            self._process_event(event)
         
         # Run daemons
         for daemon_name, daemon_func in self.daemons.items():
@@ -91,6 +98,8 @@ class TimeManager:
                 daemon_func()
             except Exception as e:
                 logger.error(f"Daemon {daemon_name} error: {e}")
+        
+        return events
     
     def get_current_events(self) -> List[GameEvent]:
         """Get events scheduled for current time"""
@@ -15,6 +15,10 @@ class EvidenceManager:
         self.collected_evidence: Set[str] = set()
         self.evidence_values: Dict[str, int] = {}
         self.evidence_descriptions: Dict[str, str] = {}
+        # Running sum of evidence_values over collected_evidence
+        self._value_total: int = 0
+        # Bumped whenever collected_evidence or the accusation changes
+        self.evidence_version: int = 0
         
         # Case solving
         self.accusation_made: bool = False
@@ -35,29 +39,55 @@ class EvidenceManager:
         """
         if evidence_id not in self.collected_evidence:
             self.collected_evidence.add(evidence_id)
+            self._value_total += self.evidence_values.get(evidence_id, 0)
+            self.evidence_version += 1
             logger.info(f"Evidence collected: {evidence_id}")
             return True
         return False
     
+    def try_collect(self, evidence_id: str, is_evidence: Any = True) -> bool:
+        """
+        Collect evidence_id if is_evidence is truthy
+        Returns True if newly collected
+        """
+        return bool(is_evidence) and self.collect_evidence(evidence_id)
+    
+    def collect_many(self, evidence_ids) -> int:
+        """
+        Collect several pieces of evidence at once
+        Returns the number newly collected
+        """
+        new_ids = set(evidence_ids) - self.collected_evidence
+        if new_ids:
+            self.collected_evidence |= new_ids
+            values = self.evidence_values
+            self._value_total += sum([values.get(e, 0) for e in new_ids])
+            self.evidence_version += 1
+            logger.info(f"Evidence collected: {', '.join(sorted(new_ids))}")
+        return len(new_ids)
+    
     def has_evidence(self, evidence_id: str) -> bool:
         """Check if evidence has been collected"""
         return evidence_id in self.collected_evidence
     
+    def restore_collected(self, evidence_ids):
+        """Replace the collected set wholesale (e.g. from a save)"""
+        self.collected_evidence = set(evidence_ids)
+        values = self.evidence_values
+        self._value_total = sum([values.get(e, 0) for e in self.collected_evidence])
+        self.evidence_version += 1
+    
     def get_evidence_count(self) -> int:
         """Get total number of evidence pieces collected"""
         return len(self.collected_evidence)
     
     def get_evidence_value(self) -> int:
-        """Calculate total value of collected evidence"""
-        total = 0
-        for evidence_id in self.collected_evidence:
-            total += self.evidence_values.get(evidence_id, 0)
-        return total
+        """Total value of collected evidence, kept up to date on collection"""
+        return self._value_total
     
     def has_sufficient_evidence(self) -> bool:
         """Check if player has enough evidence to solve the case"""
-        required = set(self.solution.get('required_evidence', []))
-        return required.issubset(self.collected_evidence)
+        return self.collected_evidence.issuperset(self.solution.get('required_evidence', ()))
     
     def make_accusation(self, person: str) -> tuple[bool, str]:
         """
@@ -66,6 +96,7 @@ class EvidenceManager:
         """
         self.accusation_made = True
         self.accused_person = person
+        self.evidence_version += 1
         
         correct_murderer = self.solution.get('murderer')
         
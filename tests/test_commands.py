@@ -4,7 +4,8 @@
 import pytest
 from unittest.mock import Mock, MagicMock
 from deadline.commands.manipulation import TakeCommand
-from deadline.commands.base_command import CommandStatus
+from deadline.commands.examination import ExamineCommand
+from deadline.commands.base_command import CommandProcessor, CommandStatus
 
 
 class TestCommands:
@@ -28,4 +29,35 @@ class TestCommands:
         mock_engine.world_manager.player.can_carry.return_value = True
         
         result = cmd.execute(parse_result)
-        assert result.status == CommandStatus.SUCCESS
\ No newline at end of file
+        assert result.status == CommandStatus.SUCCESS
+    
+    def test_direct_object_resolved_once_per_turn(self, mock_engine):
+        cmd = ExamineCommand(mock_engine)
+        parse_result = Mock()
+        parse_result.direct_object = "lamp"
+        first, second = Mock(), Mock()
+        mock_engine.world_manager.find_object.side_effect = [first, second]
+        
+        cmd.begin_turn()
+        assert cmd.get_direct_object(parse_result) is first
+        assert cmd.get_direct_object(parse_result) is first
+        
+        # A repeated command ('again') must not reuse the last turn's object
+        cmd.begin_turn()
+        assert cmd.get_direct_object(parse_result) is second
+    
+    def test_registered_verbs_have_handlers(self, mock_engine):
+        processor = CommandProcessor(mock_engine)
+        for verb in list(processor._factories):
+            assert processor.get_command(verb) is not None, verb
+    
+    def test_missing_handler_is_unknown_verb(self, mock_engine):
+        processor = CommandProcessor(mock_engine)
+        processor.register_lazy(('frob',), 'meta_commands', 'FrobCommand')
+        assert processor.get_command('frob') is None
+    
+    def test_unknown_verb_suggestions(self, mock_engine):
+        processor = CommandProcessor(mock_engine)
+        # Same first letter first, then similar lengths in registration order
+        assert processor._find_similar_commands('b') == ['go', 'get', 'put']
+        assert processor._find_similar_commands('tak') == ['take', 'talk', 'tell']
@@ -0,0 +1,39 @@
+# 7_code_translation/tests/test_game_object.py
+"""Tests for game object containment"""
+
+import pytest
+from deadline.core.game_object import Container, Item, ObjectFlag
+
+
+class TestContainment:
+    @pytest.fixture
+    def box(self):
+        return Container(
+            id="box",
+            name="Box",
+            flags=ObjectFlag.OPEN,
+            properties={'capacity': 1, 'max_item_size': 3}
+        )
+
+    def test_limits_from_properties(self, box):
+        item = Item(id="vase", name="Vase", properties={'size': 5})
+        assert item.size == 5
+        assert box.capacity == 1
+        assert box.max_item_size == 3
+
+    def test_can_contain_respects_property_size(self, box):
+        big = Item(id="statue", name="Statue", properties={'size': 5})
+        small = Item(id="coin", name="Coin", properties={'size': 1})
+        assert not box.can_contain(big)
+        assert box.can_contain(small)
+
+    def test_can_contain_respects_property_capacity(self, box):
+        Item(id="coin", name="Coin", location=box)
+        pen = Item(id="pen", name="Pen")
+        assert not box.can_contain(pen)
+
+    def test_keywords_set_limits(self):
+        box = Container(id="crate", name="Crate", flags=ObjectFlag.OPEN, capacity=2)
+        item = Item(id="brick", name="Brick", size=4)
+        assert box.capacity == 2
+        assert item.size == 4
@@ -0,0 +1,158 @@
+# 7_code_translation/tests/test_save_system.py
+"""Tests for save file encoding and the autosave log"""
+
+import pickle
+import pytest
+from unittest.mock import Mock
+
+from deadline.core.exceptions import SaveLoadException
+from deadline.io import save_system
+from deadline.io.save_system import SaveManager, _read_save, _AUTOSAVE_NAME
+
+
+def make_state(score=0, desk_open=False):
+    """Save data shaped like SaveManager._gather_state()"""
+    return {
+        'version': '1.0',
+        'timestamp': '2024-01-01T08:00:00',
+        'engine_state': {'state': 'PLAYING', 'score': score, 'moves': score},
+        'world_state': {
+            'object_states': {
+                'desk': {'flags': 1 if desk_open else 0},
+                'lamp': {'flags': 0},
+            },
+            'current_room_id': 'hall',
+            'character_states': {},
+        },
+        'time_state': {'current_time': 480 + score},
+        'evidence_state': {'collected_evidence': []},
+    }
+
+
+@pytest.fixture
+def save_manager(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = SaveManager(Mock())
+    yield manager
+    manager._writer.shutdown()
+
+
+class TestSaveFiles:
+    def save(self, manager, filename, state):
+        manager._gather_state = lambda: state
+        assert manager.save(filename)
+        manager.flush()
+        return manager.save_dir / filename
+
+    def test_framed_save_round_trip(self, save_manager):
+        path = self.save(save_manager, "game.sav", make_state(5, desk_open=True))
+
+        assert path.read_bytes().startswith(save_system._MAGIC)
+        assert _read_save(path) == make_state(5, desk_open=True)
+
+    def test_legacy_pickle_save_loads(self, save_manager):
+        path = save_manager.save_dir / "old.sav"
+        path.write_bytes(pickle.dumps(make_state(7)))
+
+        assert _read_save(path) == make_state(7)
+
+    def test_empty_save_raises(self, save_manager):
+        path = save_manager.save_dir / "empty.sav"
+        path.write_bytes(b"")
+
+        with pytest.raises(SaveLoadException):
+            _read_save(path)
+        with pytest.raises(SaveLoadException):
+            save_manager.load("empty.sav")
+
+    @pytest.mark.parametrize("filename", ["game.sav", _AUTOSAVE_NAME])
+    def test_truncated_save_raises(self, save_manager, filename):
+        save_manager._gather_state = lambda: make_state(3)
+        if filename == _AUTOSAVE_NAME:
+            save_manager.autosave()
+            save_manager.flush()
+        else:
+            self.save(save_manager, filename, make_state(3))
+        path = save_manager.save_dir / filename
+        data = path.read_bytes()
+        path.write_bytes(data[:len(data) // 2])
+
+        with pytest.raises(SaveLoadException):
+            _read_save(path)
+
+    def test_save_to_missing_directory_raises(self, save_manager):
+        save_manager._gather_state = lambda: make_state()
+
+        with pytest.raises(SaveLoadException):
+            save_manager.save("no_such_dir/game.sav")
+
+    def test_background_failure_reported_by_flush(self, save_manager, monkeypatch):
+        monkeypatch.setattr(save_system, '_frame_save', Mock(side_effect=OSError("disk full")))
+        save_manager._gather_state = lambda: make_state()
+        save_manager.save("game.sav")
+
+        with pytest.raises(SaveLoadException):
+            save_manager.flush()
+        assert not (save_manager.save_dir / "game.sav").exists()
+        # The failure is reported once
+        save_manager.flush()
+
+
+class TestAutosave:
+    def autosave(self, manager, state):
+        manager._gather_state = lambda: state
+        manager.autosave()
+        manager.flush()
+
+    def test_full_and_delta_frames_round_trip(self, save_manager):
+        for score in range(4):
+            self.autosave(save_manager, make_state(score, desk_open=score >= 2))
+
+        assert save_manager._autosave_deltas == 3
+        path = save_manager.save_dir / _AUTOSAVE_NAME
+        assert _read_save(path) == make_state(3, desk_open=True)
+
+    def test_rebase_starts_a_fresh_file(self, save_manager, monkeypatch):
+        monkeypatch.setattr(save_system, '_AUTOSAVE_REBASE', 2)
+        path = save_manager.save_dir / _AUTOSAVE_NAME
+        sizes = []
+        for score in range(4):
+            self.autosave(save_manager, make_state(score))
+            sizes.append(path.stat().st_size)
+
+        # Full frame, two deltas, then a new full frame replaces the file
+        assert sizes[0] < sizes[1] < sizes[2]
+        assert sizes[3] < sizes[2]
+        assert save_manager._autosave_deltas == 0
+        assert _read_save(path) == make_state(3)
+
+    @pytest.mark.parametrize("codec", ["zlib", "zstd"])
+    def test_codecs_round_trip(self, save_manager, monkeypatch, codec):
+        if codec == "zstd":
+            pytest.importorskip("zstandard")
+        else:
+            monkeypatch.setattr(save_system, 'zstandard', None)
+
+        self.autosave(save_manager, make_state(0))
+        self.autosave(save_manager, make_state(1, desk_open=True))
+
+        path = save_manager.save_dir / _AUTOSAVE_NAME
+        # Codec id is the first byte of the first frame header
+        expected = save_system._CODEC_ZSTD if codec == "zstd" else save_system._CODEC_ZLIB
+        assert path.read_bytes()[len(save_system._AUTOSAVE_MAGIC) + 1] == expected
+        assert _read_save(path) == make_state(1, desk_open=True)
+
+    def test_failed_write_forces_a_full_frame(self, save_manager, monkeypatch):
+        path = save_manager.save_dir / _AUTOSAVE_NAME
+        self.autosave(save_manager, make_state(0))
+
+        compress = save_system._compress
+        monkeypatch.setattr(save_system, '_compress', Mock(side_effect=OSError("disk full")))
+        self.autosave(save_manager, make_state(1))
+        assert save_manager._autosave_state is None
+        assert _read_save(path) == make_state(0)
+
+        monkeypatch.setattr(save_system, '_compress', compress)
+        self.autosave(save_manager, make_state(2))
+        assert save_manager._autosave_deltas == 0
+        assert _read_save(path) == make_state(2)